@@ -4,11 +4,66 @@ LinkedIn OAuth 2.0 Token Generator
 """
 
 import os
+import re
+import queue
+import stat
+import threading
 import requests
 import webbrowser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlencode, parse_qs, urlparse
 from dotenv import load_dotenv
 
+# Shared session: reuses TLS connections and retries transient failures,
+# honouring LinkedIn's Retry-After header on 429s
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        respect_retry_after_header=True,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False
+    )
+))
+
+CALLBACK_TIMEOUT_SECONDS = 300
+# Stops before the line ending so CRLF files keep their \r
+TOKEN_LINE_RE = re.compile(r'^LINKEDIN_ACCESS_TOKEN=[^\r\n]*')
+
+def start_callback_server(host, port, callback_path, code_queue):
+    """Start a background HTTP server that captures the OAuth redirect."""
+    
+    class CallbackHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path != callback_path:
+                self.send_error(404)
+                return
+            
+            params = parse_qs(url.query)
+            code_queue.put({
+                'code': params.get('code', [''])[0],
+                'state': params.get('state', [''])[0],
+                'error': params.get('error_description', params.get('error', ['']))[0]
+            })
+            
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.end_headers()
+            self.wfile.write(b"<html><body><h3>Authorization received. You may close this tab.</h3></body></html>")
+        
+        def log_message(self, format, *args):
+            pass
+    
+    server = HTTPServer((host, port), CallbackHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
 def get_linkedin_token():
     """Get LinkedIn access token through OAuth 2.0 flow."""
     print("🔑 LinkedIn OAuth 2.0 Token Generator")
@@ -46,6 +101,15 @@ def get_linkedin_token():
     
     auth_url_with_params = f"{auth_url}?{urlencode(auth_params)}"
     
+    # Listen for the redirect before sending the user to LinkedIn
+    code_queue = queue.Queue()
+    redirect = urlparse(redirect_uri)
+    try:
+        server = start_callback_server(redirect.hostname, redirect.port, redirect.path, code_queue)
+    except OSError as e:
+        print(f"⚠️  Could not start callback server on {redirect.netloc}: {e}")
+        server = None
+    
     print("Step 1: Authorization")
     print(f"Opening browser to: {auth_url_with_params}")
     print("\nIf browser doesn't open automatically, copy and paste the URL above")
@@ -56,15 +120,35 @@ def get_linkedin_token():
     except:
         print("Could not open browser automatically")
     
-    print("\nAfter authorization, you'll be redirected to a URL like:")
-    print("http://localhost:8000/callback?code=AUTHORIZATION_CODE&state=random_state_string")
-    
-    # Step 2: Get authorization code from user
+    # Step 2: Get authorization code
     print("\n" + "=" * 50)
-    print("Step 2: Enter Authorization Code")
-    print("Copy the 'code' parameter from the redirect URL above")
+    print("Step 2: Waiting for Authorization Code")
     
-    auth_code = input("Enter authorization code: ").strip()
+    if server:
+        print(f"Listening on {redirect_uri} (timeout: {CALLBACK_TIMEOUT_SECONDS}s)...")
+        try:
+            callback = code_queue.get(timeout=CALLBACK_TIMEOUT_SECONDS)
+        except queue.Empty:
+            print("❌ Timed out waiting for LinkedIn redirect")
+            return None
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        if callback['error']:
+            print(f"❌ Authorization failed: {callback['error']}")
+            return None
+        
+        if callback['state'] != auth_params['state']:
+            print("❌ State mismatch in redirect, aborting")
+            return None
+        
+        auth_code = callback['code']
+    else:
+        print("After authorization, you'll be redirected to a URL like:")
+        print("http://localhost:8000/callback?code=AUTHORIZATION_CODE&state=random_state_string")
+        print("Copy the 'code' parameter from the redirect URL above")
+        auth_code = input("Enter authorization code: ").strip()
     
     if not auth_code:
         print("❌ No authorization code provided")
@@ -84,7 +168,7 @@ def get_linkedin_token():
     }
     
     try:
-        response = requests.post(token_url, data=token_data)
+        response = _SESSION.post(token_url, data=token_data)
         
         if response.status_code == 200:
             token_info = response.json()
@@ -110,29 +194,42 @@ def get_linkedin_token():
 def save_token_to_env(access_token):
     """Save access token to .env file."""
     env_file = ".env"
+    tmp_file = f"{env_file}.tmp"
+    token_line = f"LINKEDIN_ACCESS_TOKEN={access_token}"
     
-    # Read existing .env file
-    env_lines = []
+    # Stream the existing .env into a temp file, updating LINKEDIN_ACCESS_TOKEN
+    # in place; newline='' keeps each line's own ending
+    replaced = False
+    last_line = ""
+    newline = '\n'
     if os.path.exists(env_file):
-        with open(env_file, 'r') as f:
-            env_lines = f.readlines()
-    
-    # Update or add LINKEDIN_ACCESS_TOKEN
-    token_line = f"LINKEDIN_ACCESS_TOKEN={access_token}\n"
-    token_updated = False
-    
-    for i, line in enumerate(env_lines):
-        if line.startswith('LINKEDIN_ACCESS_TOKEN='):
-            env_lines[i] = token_line
-            token_updated = True
-            break
-    
-    if not token_updated:
-        env_lines.append(token_line)
+        # Created owner-only so the secrets are never readable by others,
+        # then given the original file's mode before it is swapped in
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with open(env_file, 'r', newline='') as src, open(fd, 'w', newline='') as dst:
+                for line in src:
+                    if not replaced and TOKEN_LINE_RE.match(line):
+                        line = TOKEN_LINE_RE.sub(lambda m: token_line, line, count=1)
+                        replaced = True
+                    dst.write(line)
+                    last_line = line
+                    if line.endswith('\r\n'):
+                        newline = '\r\n'
+            if replaced:
+                os.chmod(tmp_file, stat.S_IMODE(os.stat(env_file).st_mode))
+                os.replace(tmp_file, env_file)
+        finally:
+            # Left behind when nothing was replaced or the swap failed
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
     
-    # Write back to .env file
-    with open(env_file, 'w') as f:
-        f.writelines(env_lines)
+    if not replaced:
+        # Append without rewriting the rest of the file, matching its line endings
+        with open(env_file, 'a', newline='') as f:
+            if last_line and not last_line.endswith('\n'):
+                f.write(newline)
+            f.write(f"{token_line}{newline}")
     
     print(f"✅ Access token saved to {env_file}")
 
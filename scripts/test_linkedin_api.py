@@ -5,8 +5,78 @@ Test LinkedIn API Credentials
 
 import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+# Shared session: reuses TLS connections and retries transient failures,
+# honouring LinkedIn's Retry-After header on 429s
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        respect_retry_after_header=True,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False
+    )
+))
+
+# Endpoints probed together when testing credentials; only 'profile' must succeed
+DIAGNOSTIC_ENDPOINTS = {
+    'profile': 'https://api.linkedin.com/v2/me',
+    'userinfo': 'https://api.linkedin.com/v2/userinfo',
+    'organization_acls': 'https://api.linkedin.com/v2/organizationAcls?q=roleAssignee',
+}
+
+def rate_limit_remaining(results):
+    """Return the lowest X-RateLimit-Remaining across responses, or None.
+    
+    Missing or non-integer header values are ignored.
+    """
+    remaining = []
+    for result in results.values():
+        if isinstance(result, Exception):
+            continue
+        try:
+            remaining.append(int(result.headers['X-RateLimit-Remaining']))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return min(remaining) if remaining else None
+
+def probe_endpoints(headers, endpoints=DIAGNOSTIC_ENDPOINTS):
+    """Call API endpoints concurrently and return each response (or exception) by name."""
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        futures = {
+            name: executor.submit(_SESSION.get, url, headers=headers, timeout=30)
+            for name, url in endpoints.items()
+        }
+    
+    results = {}
+    for name, future in futures.items():
+        try:
+            results[name] = future.result()
+        except Exception as e:
+            results[name] = e
+    return results
+
+def print_diagnostics(results):
+    """Print the status of the secondary diagnostic endpoints."""
+    for name, result in results.items():
+        if name == 'profile':
+            continue
+        if isinstance(result, Exception):
+            print(f"   {name}: error ({result})")
+        else:
+            print(f"   {name}: HTTP {result.status_code}")
+    
+    remaining = rate_limit_remaining(results)
+    if remaining is not None:
+        print(f"   Rate limit remaining: {remaining}")
+
 def test_linkedin_credentials():
     """Test LinkedIn API credentials."""
     print("🔑 Testing LinkedIn API Credentials")
@@ -41,19 +111,23 @@ def test_linkedin_credentials():
     }
     
     try:
-        # Test profile API
-        profile_url = 'https://api.linkedin.com/v2/me'
-        response = requests.get(profile_url, headers=headers)
+        # Test profile API alongside the other diagnostic endpoints
+        results = probe_endpoints(headers)
+        response = results['profile']
+        if isinstance(response, Exception):
+            raise response
         
         if response.status_code == 200:
             profile_data = response.json()
             print("✅ API Connection Successful!")
             print(f"   Profile: {profile_data.get('localizedFirstName', '')} {profile_data.get('localizedLastName', '')}")
             print(f"   ID: {profile_data.get('id', '')}")
+            print_diagnostics(results)
             return True
         else:
             print(f"❌ API Connection Failed: {response.status_code}")
             print(f"   Response: {response.text}")
+            print_diagnostics(results)
             return False
             
     except Exception as e:
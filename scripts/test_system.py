@@ -3,25 +3,112 @@
 Test script for LinkedIn Post Automation System
 """
 
+import io
 import logging
+import multiprocessing
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
+import orjson
+from bs4 import BeautifulSoup
+
+# Make the repository root importable so `src` resolves as a package
+# when the script is run directly from any working directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from src.config import config
-from src.newsletter_scraper import NewsletterScraper
-from src.content_processor import ContentProcessor
-from src.post_generator import PostGenerator
-from src.scheduler import PostScheduler
+from src.newsletter_scraper import _extract_article_data, _extract_article_data_from_html, get_scraper
+from src.content_processor import get_processor
+from src.post_generator import get_generator
+from src.scheduler import PostScheduler, get_scheduler
+
+# Sample inputs shared by the tests; the pipeline builds new dicts and never
+# mutates these, so they are defined once instead of per test
+SAMPLE_ARTICLE = {
+    'title': 'Test AI Article',
+    'summary': 'This is a test article about artificial intelligence and machine learning.',
+    'insights': ['AI is transforming industries', 'Machine learning is key'],
+    'link': 'https://example.com',
+    'source': 'test'
+}
+
+SAMPLE_PROCESSED_ARTICLE = {
+    'title': 'Test AI Article',
+    'summary': 'This is a test article about artificial intelligence and machine learning.',
+    'key_insights': ['AI is transforming industries', 'Machine learning is key'],
+    'hashtags': ['#AI', '#MachineLearning'],
+    'link': 'https://example.com',
+    'content_score': 0.8
+}
+
+SAMPLE_ARTICLES = (
+    {
+        'title': 'Breakthrough in AI Research',
+        'summary': 'Researchers have developed a new machine learning algorithm that improves accuracy by 15%.',
+        'insights': ['15% accuracy improvement', 'New algorithm developed', 'Research breakthrough'],
+        'link': 'https://example.com/ai-research',
+        'source': 'deeplearning_ai',
+        'date': '2024-01-15'
+    },
+    {
+        'title': 'Data Science Trends 2024',
+        'summary': 'Key trends in data science and machine learning for 2024 include automated ML and edge computing.',
+        'insights': ['Automated ML growing', 'Edge computing important', '2024 trends identified'],
+        'link': 'https://example.com/trends-2024',
+        'source': 'deeplearning_ai',
+        'date': '2024-01-14'
+    }
+)
+
+SAMPLE_ARTICLE_HTML = (
+    '<article class="post-card">'
+    '<h2><a href="/the-batch/ai-research/">Breakthrough in AI Research</a></h2>'
+    '<p class="post-summary">A new machine learning algorithm improves accuracy by 15%.</p>'
+    '<time class="post-date">Jan 15, 2024</time>'
+    '<ul><li>15% accuracy improvement on benchmarks</li><li>New algorithm developed</li></ul>'
+    '</article>'
+)
+
+_PREVIEW_CHARS = 50
+_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+def preview(text, limit=_PREVIEW_CHARS):
+    """Shorten text for display, marking it only when something was cut."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+class _ThreadStdout:
+    """stdout proxy that buffers writes from threads that opted in."""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def capture(self):
+        self._local.buffer = io.StringIO()
+    
+    def release(self):
+        buffer = self._local.__dict__.pop('buffer')
+        return buffer.getvalue()
+    
+    def write(self, text):
+        return getattr(self._local, 'buffer', self._stream).write(text)
+    
+    def flush(self):
+        self._stream.flush()
 
 def setup_logging():
     """Setup basic logging for testing."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    if not root.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(_LOG_FORMATTER)
+        root.addHandler(handler)
 
 def test_configuration():
     """Test configuration loading."""
@@ -45,13 +132,28 @@ def test_newsletter_scraper():
     """Test newsletter scraper initialization."""
     print("\n=== Testing Newsletter Scraper ===")
     try:
-        scraper = NewsletterScraper()
+        scraper = get_scraper()
         print("✓ Newsletter scraper initialized successfully")
         
         # Test fetching (this will fail without actual content, but tests the structure)
         sources = scraper.newsletter_sources
         print(f"✓ Found {len(sources)} newsletter sources")
         
+        # The worker path re-parses serialized HTML in another process; it
+        # must yield exactly what the serial path extracts from the soup
+        element = BeautifulSoup(SAMPLE_ARTICLE_HTML, 'html.parser').find()
+        scraped_at = '2024-01-15T00:00:00'
+        serial = _extract_article_data(element, scraper._base_url, scraped_at)
+        # Spawned, not forked: the other tests are running on threads
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as executor:
+            worker = executor.submit(
+                _extract_article_data_from_html, str(element), scraper._base_url, scraped_at
+            ).result()
+        if not serial or serial != worker:
+            print(f"✗ Serial and worker extraction differ: {serial} != {worker}")
+            return False
+        print("✓ Serial and worker extraction match")
+        
         return True
     except Exception as e:
         print(f"✗ Newsletter scraper test failed: {e}")
@@ -61,19 +163,11 @@ def test_content_processor():
     """Test content processor initialization."""
     print("\n=== Testing Content Processor ===")
     try:
-        processor = ContentProcessor()
+        processor = get_processor()
         print("✓ Content processor initialized successfully")
         
         # Test with sample data
-        sample_article = {
-            'title': 'Test AI Article',
-            'summary': 'This is a test article about artificial intelligence and machine learning.',
-            'insights': ['AI is transforming industries', 'Machine learning is key'],
-            'link': 'https://example.com',
-            'source': 'test'
-        }
-        
-        processed = processor.process_single_article(sample_article)
+        processed = processor.process_single_article(SAMPLE_ARTICLE)
         if processed:
             print(f"✓ Sample article processed successfully")
             print(f"  - Content score: {processed.get('content_score', 0):.2f}")
@@ -91,25 +185,16 @@ def test_post_generator():
     """Test post generator."""
     print("\n=== Testing Post Generator ===")
     try:
-        generator = PostGenerator()
+        generator = get_generator()
         print("✓ Post generator initialized successfully")
         
         # Test with sample processed article
-        sample_processed = {
-            'title': 'Test AI Article',
-            'summary': 'This is a test article about artificial intelligence and machine learning.',
-            'key_insights': ['AI is transforming industries', 'Machine learning is key'],
-            'hashtags': ['#AI', '#MachineLearning'],
-            'link': 'https://example.com',
-            'content_score': 0.8
-        }
-        
-        post = generator.generate_single_post(sample_processed)
+        post = generator.generate_single_post(SAMPLE_PROCESSED_ARTICLE)
         if post:
             print(f"✓ Sample post generated successfully")
             print(f"  - Post length: {post.get('post_length', 0)} characters")
             print(f"  - Engagement score: {post.get('engagement_score', 0):.2f}")
-            print(f"  - Template used: {post.get('template_used', 'Unknown')[:50]}...")
+            print(f"  - Template used: {preview(post.get('template_used', 'Unknown'))}")
         else:
             print("✗ Sample post generation failed")
             return False
@@ -123,7 +208,7 @@ def test_scheduler():
     """Test scheduler initialization."""
     print("\n=== Testing Scheduler ===")
     try:
-        scheduler = PostScheduler()
+        scheduler = get_scheduler()
         print("✓ Scheduler initialized successfully")
         
         # Test queue status
@@ -134,47 +219,80 @@ def test_scheduler():
         analytics = scheduler.get_posting_analytics()
         print(f"✓ Analytics loaded: {len(analytics)} metrics")
         
+        # A post left pending from a day ago must be marked missed on load,
+        # never published late
+        with tempfile.TemporaryDirectory() as tmp:
+            posts_file = Path(tmp) / 'scheduled_posts.json'
+            overdue = {
+                'post': {'content': 'Overdue post'},
+                'scheduled_time': (datetime.now() - timedelta(days=1)).isoformat(),
+                'status': 'scheduled',
+                'post_id': 'post_overdue_0'
+            }
+            posts_file.write_bytes(orjson.dumps([overdue]))
+            stale = PostScheduler(dry_run=True, posts_file=str(posts_file),
+                                  events_file=str(Path(tmp) / 'scheduled_posts.jsonl'))
+            due_posts = stale._pop_due_posts(time.time())
+            if due_posts or stale.get_scheduled_posts('missed') != stale.scheduled_posts:
+                print("✗ Overdue post was queued for publishing")
+                return False
+        print("✓ Overdue post marked missed, not published")
+        
         return True
     except Exception as e:
         print(f"✗ Scheduler test failed: {e}")
         return False
 
+def run_pipeline(articles, processor, generator, max_posts, batch_size=1):
+    """Generate posts while later article batches are still being processed.
+    
+    Each batch goes through the batch entry points main.py uses
+    (process_articles, then generate_posts); posts are kept in batch order
+    and capped at max_posts.
+    """
+    batches = [list(articles[i:i + batch_size]) for i in range(0, len(articles), batch_size)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        processed_futures = [executor.submit(processor.process_articles, batch) for batch in batches]
+        
+        # Hand each batch to the generator as soon as its own processing finishes
+        post_futures = []
+        for future in processed_futures:
+            processed = future.result()
+            if processed:
+                post_futures.append(executor.submit(generator.generate_posts, processed, max_posts))
+        
+        posts = [post for future in post_futures for post in future.result()]
+    return posts[:max_posts]
+
 def test_full_pipeline():
     """Test the complete pipeline with sample data."""
     print("\n=== Testing Full Pipeline ===")
     try:
-        # Sample articles
-        sample_articles = [
-            {
-                'title': 'Breakthrough in AI Research',
-                'summary': 'Researchers have developed a new machine learning algorithm that improves accuracy by 15%.',
-                'insights': ['15% accuracy improvement', 'New algorithm developed', 'Research breakthrough'],
-                'link': 'https://example.com/ai-research',
-                'source': 'deeplearning_ai',
-                'date': '2024-01-15'
-            },
-            {
-                'title': 'Data Science Trends 2024',
-                'summary': 'Key trends in data science and machine learning for 2024 include automated ML and edge computing.',
-                'insights': ['Automated ML growing', 'Edge computing important', '2024 trends identified'],
-                'link': 'https://example.com/trends-2024',
-                'source': 'deeplearning_ai',
-                'date': '2024-01-14'
-            }
-        ]
+        processor = get_processor()
+        generator = get_generator()
         
-        # Step 1: Process content
-        processor = ContentProcessor()
-        processed_articles = processor.process_articles(sample_articles)
-        print(f"✓ Processed {len(processed_articles)} articles")
+        # Batch processing drops near-duplicates and stamps one processed_at
+        processed_articles = processor.process_articles(list(SAMPLE_ARTICLES) + [SAMPLE_ARTICLES[0]])
+        if len(processed_articles) != len(SAMPLE_ARTICLES):
+            print(f"✗ Expected {len(SAMPLE_ARTICLES)} processed articles after dedup, got {len(processed_articles)}")
+            return False
+        if len({article['processed_at'] for article in processed_articles}) != 1:
+            print("✗ Processed articles in one batch have different processed_at stamps")
+            return False
+        print(f"✓ Processed {len(processed_articles)} articles (duplicate dropped)")
+        
+        posts = generator.generate_posts(processed_articles, max_posts=1)
+        if len(posts) != 1:
+            print(f"✗ generate_posts ignored max_posts: got {len(posts)} posts")
+            return False
+        print("✓ Batch generation respects max_posts")
         
-        # Step 2: Generate posts
-        generator = PostGenerator()
-        posts = generator.generate_posts(processed_articles, max_posts=2)
-        print(f"✓ Generated {len(posts)} posts")
+        # Steps 1-2: Process content and generate posts as overlapping stages
+        posts = run_pipeline(SAMPLE_ARTICLES, processor, generator, max_posts=2)
+        print(f"✓ Generated {len(posts)} posts from {len(SAMPLE_ARTICLES)} articles")
         
         # Step 3: Schedule posts
-        scheduler = PostScheduler()
+        scheduler = get_scheduler()
         scheduled_posts = scheduler.schedule_posts(posts)
         print(f"✓ Scheduled {len(scheduled_posts)} posts")
         
@@ -183,6 +301,23 @@ def test_full_pipeline():
         print(f"✗ Full pipeline test failed: {e}")
         return False
 
+def _run_test(test):
+    """Run one test, reporting unexpected exceptions as failures."""
+    try:
+        return bool(test())
+    except Exception as e:
+        print(f"✗ Test {test.__name__} failed with exception: {e}")
+        return False
+
+def _run_captured(test, stdout):
+    """Run one test in a worker thread and return (passed, printed output)."""
+    stdout.capture()
+    try:
+        result = _run_test(test)
+    finally:
+        output = stdout.release()
+    return result, output
+
 def main():
     """Run all tests."""
     print("LinkedIn Post Automation System - Test Suite")
@@ -199,15 +334,25 @@ def main():
         test_full_pipeline
     ]
     
-    passed = 0
     total = len(tests)
     
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-        except Exception as e:
-            print(f"✗ Test {test.__name__} failed with exception: {e}")
+    # The first tests are independent, so they run concurrently; the full
+    # pipeline test writes scheduler state and runs on its own afterwards.
+    # Each test's output is buffered and written out in one call, in order
+    independent, dependent = tests[:-1], tests[-1:]
+    stdout = _ThreadStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=len(independent)) as executor:
+            outcomes = list(executor.map(lambda test: _run_captured(test, stdout), independent))
+        outcomes += [_run_captured(test, stdout) for test in dependent]
+    finally:
+        sys.stdout = stdout._stream
+    
+    passed = 0
+    for result, output in outcomes:
+        sys.stdout.write(output)
+        passed += result
     
     print("\n" + "=" * 50)
     print(f"Test Results: {passed}/{total} tests passed")
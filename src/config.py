@@ -2,18 +2,96 @@
 Configuration management for LinkedIn Post Automation
 """
 
+import hashlib
 import os
+import orjson
 import yaml
-from typing import Dict, Any, Optional
+from functools import cached_property
+from typing import Dict, Any, Mapping, Optional, Tuple
 from pathlib import Path
 import logging
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Parsed configuration files keyed by (path, mtime)
+_CONFIG_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+# JSON copy of the parsed YAML, kept in the user cache directory (not next to
+# the tracked YAML) and reused while the YAML mtime matches
+_SIDECAR_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'linkedin_post_automation'
+
+
+def _sidecar_path(config_file: Path) -> Path:
+    """Return the cache file for a YAML config, one per resolved path."""
+    digest = hashlib.sha1(str(config_file.resolve()).encode('utf-8')).hexdigest()[:16]
+    return _SIDECAR_DIR / f"{config_file.stem}-{digest}.json"
+
+
+def _read_sidecar(sidecar: Path, mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """Return the cached configuration if the sidecar matches the YAML mtime."""
+    try:
+        cached = orjson.loads(sidecar.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if not isinstance(cached, dict) or cached.get('mtime_ns') != mtime_ns:
+        return None
+    return cached.get('config')
+
+
+def _write_sidecar(sidecar: Path, mtime_ns: int, data: Dict[str, Any]) -> None:
+    """Atomically write the parsed configuration to the cache directory.
+    
+    Skipped when the config does not survive a JSON round trip unchanged:
+    orjson serializes YAML dates and timestamps, but they would read back as
+    strings, so such configs are always loaded from the YAML.
+    """
+    try:
+        config_blob = orjson.dumps(data)
+        if orjson.loads(config_blob) != data:
+            logging.debug("Config has values JSON cannot round-trip; not caching it")
+            return
+    except TypeError as e:
+        logging.debug(f"Config is not JSON serializable; not caching it: {e}")
+        return
+    
+    tmp = sidecar.with_name(sidecar.name + '.tmp')
+    try:
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(b'{"mtime_ns":%d,"config":%s}' % (mtime_ns, config_blob))
+        os.replace(tmp, sidecar)
+    except OSError as e:
+        # Unwritable cache directory: keep loading from the YAML
+        logging.debug(f"Could not write config cache {sidecar}: {e}")
+        tmp.unlink(missing_ok=True)
+
+class _ReadOnlySection(dict):
+    """Read-only config section; unlike MappingProxyType it pickles for worker pools."""
+    
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("configuration sections are read-only")
+    
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+    
+    def __reduce__(self):
+        return (_ReadOnlySection, (dict(self),))
+
 class Config:
     """Configuration manager for the LinkedIn post automation system."""
     
+    # Hot settings resolved once per load; cleared on reload()
+    _CACHED_PROPERTIES = ('min_post_length', 'max_post_length', 'max_hashtags', 'default_hashtags')
+    
     def __init__(self, config_path: str = "config/settings.yaml"):
         self.config_path = config_path
         self._config = None
+        self._cache = {}
+        self._splits = {}
+        self._sections = {}
         self._load_config()
     
     def _load_config(self) -> None:
@@ -23,8 +101,17 @@ class Config:
             if not config_file.exists():
                 raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
             
-            with open(config_file, 'r', encoding='utf-8') as file:
-                self._config = yaml.safe_load(file)
+            mtime_ns = config_file.stat().st_mtime_ns
+            cache_key = (str(config_file.resolve()), mtime_ns)
+            if cache_key not in _CONFIG_CACHE:
+                sidecar = _sidecar_path(config_file)
+                data = _read_sidecar(sidecar, mtime_ns)
+                if data is None:
+                    with open(config_file, 'r', encoding='utf-8') as file:
+                        data = yaml.load(file, Loader=_Loader)
+                    _write_sidecar(sidecar, mtime_ns, data)
+                _CONFIG_CACHE[cache_key] = data
+            self._config = _CONFIG_CACHE[cache_key]
                 
         except Exception as e:
             logging.error(f"Failed to load configuration: {e}")
@@ -32,46 +119,88 @@ class Config:
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value using dot notation."""
-        keys = key.split('.')
+        if key in self._cache:
+            return self._cache[key]
+        
+        keys = self._splits.get(key)
+        if keys is None:
+            keys = self._splits[key] = tuple(key.split('.'))
         value = self._config
         
         try:
             for k in keys:
                 value = value[k]
-            return value
         except (KeyError, TypeError):
             return default
+        
+        self._cache[key] = value
+        return value
     
-    def get_newsletter_sources(self) -> Dict[str, Any]:
+    def _section(self, key: str) -> Mapping[str, Any]:
+        """Return a cached read-only view of a top-level config section."""
+        section = self._sections.get(key)
+        if section is None:
+            section = self._sections[key] = _ReadOnlySection(self.get(key) or {})
+        return section
+    
+    def get_newsletter_sources(self) -> Mapping[str, Any]:
         """Get newsletter sources configuration."""
-        return self.get('newsletter_sources', {})
+        return self._section('newsletter_sources')
     
-    def get_content_processing(self) -> Dict[str, Any]:
+    def get_content_processing(self) -> Mapping[str, Any]:
         """Get content processing configuration."""
-        return self.get('content_processing', {})
+        return self._section('content_processing')
+    
+    def get_scraping(self) -> Mapping[str, Any]:
+        """Get newsletter scraping configuration."""
+        return self._section('scraping')
     
-    def get_post_generation(self) -> Dict[str, Any]:
+    def get_post_generation(self) -> Mapping[str, Any]:
         """Get post generation configuration."""
-        return self.get('post_generation', {})
+        return self._section('post_generation')
     
-    def get_scheduling(self) -> Dict[str, Any]:
+    def get_scheduling(self) -> Mapping[str, Any]:
         """Get scheduling configuration."""
-        return self.get('scheduling', {})
+        return self._section('scheduling')
     
-    def get_linkedin_config(self) -> Dict[str, Any]:
+    def get_linkedin_config(self) -> Mapping[str, Any]:
         """Get LinkedIn API configuration."""
-        return self.get('linkedin', {})
+        return self._section('linkedin')
     
-    def get_logging_config(self) -> Dict[str, Any]:
+    def get_logging_config(self) -> Mapping[str, Any]:
         """Get logging configuration."""
-        return self.get('logging', {})
+        return self._section('logging')
     
-    def get_monitoring_config(self) -> Dict[str, Any]:
+    def get_monitoring_config(self) -> Mapping[str, Any]:
         """Get monitoring configuration."""
-        return self.get('monitoring', {})
+        return self._section('monitoring')
+    
+    @cached_property
+    def min_post_length(self) -> int:
+        """Minimum post length in characters."""
+        return self.get('content_processing.min_post_length', 100)
+    
+    @cached_property
+    def max_post_length(self) -> int:
+        """Maximum post length in characters."""
+        return self.get('content_processing.max_post_length', 1300)
+    
+    @cached_property
+    def max_hashtags(self) -> int:
+        """Maximum number of hashtags per post."""
+        return self.get('content_processing.max_hashtags', 5)
+    
+    @cached_property
+    def default_hashtags(self) -> tuple:
+        """Hashtags added to every post."""
+        return tuple(self.get('post_generation.hashtags.default', []))
     
     def reload(self) -> None:
         """Reload configuration from file."""
+        self._cache.clear()
+        self._sections.clear()
+        for name in self._CACHED_PROPERTIES:
+            self.__dict__.pop(name, None)
         self._load_config()
     
     @property
@@ -3,49 +3,167 @@ Content Processor for LinkedIn Post Automation
 """
 
 import re
+import heapq
+import hashlib
 import logging
+import multiprocessing as mp
+from collections import Counter, defaultdict
+from functools import lru_cache, partial
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-import nltk
-from textblob import TextBlob
+import orjson
 from .config import config
 
+_WS_RE = re.compile(r'\s+')
+_ALLOWED_RE = re.compile(r'[^\w\s\-.,!?;:()]')
+_SPACE_PUNCT_RE = re.compile(r'\s+([.,!?;:])')
+_DUP_PUNCT_RE = re.compile(r'([.,!?;:])\s*([.,!?;:])')
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_AI_KEYWORDS = frozenset(('ai', 'machine learning', 'deep learning', 'artificial intelligence', 'data science'))
+_IMPORTANT_WORDS = ('ai', 'machine learning', 'deep learning', 'data', 'model', 'algorithm')
+_WORD_RE = re.compile(r"[a-z']+")
+_TOKEN_RE = re.compile(r'\w+')
+
+# Articles whose 64-bit SimHash fingerprints differ in at most this many bits
+# are treated as near-duplicates
+_SIMHASH_MAX_DISTANCE = 3
+
+# Small polarity lexicon used for the content score's sentiment signal
+_SENTIMENT_LEXICON = {
+    'new': 0.1, 'good': 0.7, 'great': 0.8, 'better': 0.5, 'best': 1.0,
+    'improve': 0.5, 'improves': 0.5, 'improved': 0.5, 'improvement': 0.5,
+    'breakthrough': 0.6, 'benefit': 0.5, 'benefits': 0.5, 'success': 0.6,
+    'successful': 0.7, 'efficient': 0.5, 'effective': 0.6, 'innovative': 0.6,
+    'innovation': 0.5, 'advance': 0.4, 'advances': 0.4, 'powerful': 0.5,
+    'promising': 0.6, 'important': 0.4, 'exciting': 0.7, 'excellent': 1.0,
+    'impressive': 0.8, 'strong': 0.4, 'faster': 0.3, 'easier': 0.4,
+    'accurate': 0.4, 'robust': 0.4, 'growth': 0.3, 'outperforms': 0.5,
+    'bad': -0.7, 'worse': -0.6, 'worst': -1.0, 'fail': -0.5, 'fails': -0.5,
+    'failure': -0.6, 'risk': -0.4, 'risks': -0.4, 'threat': -0.6,
+    'problem': -0.4, 'problems': -0.4, 'concern': -0.3, 'concerns': -0.3,
+    'difficult': -0.5, 'harmful': -0.7, 'bias': -0.4, 'biased': -0.5,
+    'decline': -0.4, 'loss': -0.4, 'lawsuit': -0.5, 'ban': -0.4,
+    'poor': -0.6, 'weak': -0.4, 'error': -0.4, 'errors': -0.4,
+    'attack': -0.6, 'misinformation': -0.7, 'dangerous': -0.7,
+}
+
+# Topic hashtags and the keywords that trigger them, in output order
+_TOPIC_HASHTAGS = (
+    ('#ArtificialIntelligence', ('ai', 'artificial intelligence')),
+    ('#MachineLearning', ('machine learning', 'ml')),
+    ('#DeepLearning', ('deep learning', 'neural network')),
+    ('#DataScience', ('data science', 'data scientist')),
+    ('#NLP', ('nlp', 'natural language')),
+    ('#ComputerVision', ('computer vision', 'cv')),
+    ('#Robotics', ('robotics', 'robot')),
+    ('#Startup', ('startup', 'entrepreneur')),
+    ('#Tech', ('tech', 'technology')),
+)
+
+def _simhash(text: str) -> int:
+    """Compute a 64-bit SimHash fingerprint of the text's word tokens."""
+    weights = [0] * 64
+    for token, count in Counter(_TOKEN_RE.findall(text.lower())).items():
+        digest = hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest()
+        token_hash = int.from_bytes(digest, 'big')
+        for bit in range(64):
+            weights[bit] += count if token_hash >> bit & 1 else -count
+    
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
 class ContentProcessor:
     """Process and format newsletter content for LinkedIn posts."""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.content_config = config.get_content_processing()
-        self._setup_nltk()
-    
-    def _setup_nltk(self):
-        """Setup NLTK data for text processing."""
-        try:
-            nltk.data.find('tokenizers/punkt')
-        except LookupError:
-            try:
-                nltk.download('punkt', quiet=True)
-            except Exception as e:
-                self.logger.warning(f"Could not download NLTK data: {e}")
+        self._max_len = config.max_post_length
+        self._max_hashtags = config.max_hashtags
+        # Defaults deduplicated once here (order preserved) rather than per article
+        self._default_hashtags = tuple(dict.fromkeys(config.default_hashtags))
     
     def process_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Process a list of articles for LinkedIn posting."""
+        articles = self._deduplicate_articles(articles)
+        parallel_min = self.content_config.get('parallel_min_articles', 200)
+        
+        # One processing timestamp for the whole batch
+        processed_at = datetime.now().isoformat()
+        
+        if len(articles) >= parallel_min and mp.cpu_count() > 1:
+            processed_articles = self._process_articles_parallel(articles, processed_at)
+        else:
+            processed_articles = self._process_articles_serial(articles, processed_at)
+        
+        self.logger.info(f"Processed {len(processed_articles)} articles")
+        return processed_articles
+    
+    def _deduplicate_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop near-duplicate articles, keeping the first of each cluster."""
+        # Split each fingerprint into four 16-bit bands; two fingerprints within
+        # _SIMHASH_MAX_DISTANCE bits of each other must share at least one band
+        bands_seen = defaultdict(list)
+        unique_articles = []
+        
+        for article in articles:
+            text = f"{article.get('title', '')} {article.get('summary', '')}"
+            if not _TOKEN_RE.search(text):
+                unique_articles.append(article)
+                continue
+            
+            fingerprint = _simhash(text)
+            bands = [(i, fingerprint >> (16 * i) & 0xFFFF) for i in range(4)]
+            
+            is_duplicate = any(
+                bin(fingerprint ^ other).count('1') <= _SIMHASH_MAX_DISTANCE
+                for band in bands for other in bands_seen[band]
+            )
+            if is_duplicate:
+                continue
+            
+            for band in bands:
+                bands_seen[band].append(fingerprint)
+            unique_articles.append(article)
+        
+        skipped = len(articles) - len(unique_articles)
+        if skipped:
+            self.logger.info(f"Skipped {skipped} near-duplicate articles")
+        return unique_articles
+    
+    def _process_articles_serial(self, articles: List[Dict[str, Any]],
+                                 processed_at: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Process articles one at a time in the current process."""
         processed_articles = []
         
         for article in articles:
             try:
-                processed = self.process_single_article(article)
+                processed = self.process_single_article(article, processed_at)
                 if processed:
                     processed_articles.append(processed)
             except Exception as e:
                 self.logger.error(f"Error processing article '{article.get('title', 'Unknown')}': {e}")
                 continue
         
-        self.logger.info(f"Processed {len(processed_articles)} articles")
         return processed_articles
     
-    def process_single_article(self, article: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Process a single article for LinkedIn posting."""
+    def _process_articles_parallel(self, articles: List[Dict[str, Any]],
+                                   processed_at: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Process articles across a pool of worker processes."""
+        try:
+            with mp.Pool(min(mp.cpu_count(), len(articles))) as pool:
+                results = pool.map(partial(self.process_single_article, processed_at=processed_at), articles)
+            return [processed for processed in results if processed]
+        except Exception as e:
+            self.logger.warning(f"Parallel processing failed, falling back to serial: {e}")
+            return self._process_articles_serial(articles, processed_at)
+    
+    def process_single_article(self, article: Dict[str, Any],
+                               processed_at: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Process a single article for LinkedIn posting.
+        
+        Batch callers pass a shared processed_at timestamp; otherwise the
+        current time is used.
+        """
         try:
             # Clean and format content
             cleaned_title = self._clean_text(article.get('title', ''))
@@ -60,8 +178,14 @@ class ContentProcessor:
             # Extract key insights
             key_insights = self._extract_key_insights(cleaned_summary, cleaned_insights)
             
+            # Lowercased title + summary, shared by the keyword and sentiment checks
+            joined_lower = f"{cleaned_title} {cleaned_summary}".lower()
+            
             # Generate hashtags
-            hashtags = self._generate_hashtags(cleaned_title, cleaned_summary)
+            hashtags = self._generate_hashtags(joined_lower)
+            
+            # Score sentiment once for the whole article
+            sentiment = self._fast_polarity(joined_lower)
             
             # Create processed article
             processed_article = {
@@ -72,8 +196,10 @@ class ContentProcessor:
                 'hashtags': hashtags,
                 'link': article.get('link', ''),
                 'source': article.get('source', ''),
-                'processed_at': datetime.now().isoformat(),
-                'content_score': self._calculate_content_score(cleaned_title, cleaned_summary, key_insights)
+                'processed_at': processed_at or datetime.now().isoformat(),
+                'content_score': self._calculate_content_score(
+                    cleaned_title, cleaned_summary, key_insights, joined_lower, sentiment
+                )
             }
             
             return processed_article
@@ -88,34 +214,27 @@ class ContentProcessor:
             return ""
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = _WS_RE.sub(' ', text.strip())
         
         # Remove special characters that might cause issues
-        text = re.sub(r'[^\w\s\-.,!?;:()]', '', text)
+        text = _ALLOWED_RE.sub('', text)
         
         # Fix common formatting issues
-        text = re.sub(r'\s+([.,!?;:])', r'\1', text)
-        text = re.sub(r'([.,!?;:])\s*([.,!?;:])', r'\1', text)
+        text = _SPACE_PUNCT_RE.sub(r'\1', text)
+        text = _DUP_PUNCT_RE.sub(r'\1', text)
         
         # Capitalize first letter of sentences
-        sentences = text.split('. ')
-        sentences = [s.capitalize() if s else s for s in sentences]
-        text = '. '.join(sentences)
-        
-        return text
+        return '. '.join(s.capitalize() for s in text.split('. '))
     
     def _validate_content_length(self, title: str, summary: str) -> bool:
         """Validate that content meets length requirements."""
-        min_length = self.content_config.get('min_post_length', 100)
-        max_length = self.content_config.get('max_post_length', 1300)
-        
         total_length = len(title) + len(summary)
         
         # Allow shorter content for testing and flexibility
         if total_length < 50:  # Very short content
             return False
         
-        return total_length <= max_length
+        return total_length <= self._max_len
     
     def _extract_key_insights(self, summary: str, insights: List[str]) -> List[str]:
         """Extract key insights from summary and existing insights."""
@@ -137,71 +256,46 @@ class ContentProcessor:
         return key_insights[:3]  # Return max 3 insights
     
     def _extract_insights_from_text(self, text: str) -> List[str]:
-        """Extract insights from text using NLP techniques."""
+        """Extract insights from text by keeping keyword-bearing sentences."""
         insights = []
         
-        try:
-            # Use TextBlob for sentiment and key phrase extraction
-            blob = TextBlob(text)
-            
-            # Extract noun phrases as potential insights
-            noun_phrases = blob.noun_phrases
-            for phrase in noun_phrases:
-                if len(phrase) > 3 and len(phrase) < 50:
-                    insights.append(f"Key focus: {phrase}")
-            
-            # Extract sentences with high information content
-            sentences = blob.sentences
-            for sentence in sentences:
-                if len(str(sentence)) > 20 and len(str(sentence)) < 100:
-                    # Check if sentence contains important keywords
-                    important_words = ['AI', 'machine learning', 'deep learning', 'data', 'model', 'algorithm']
-                    if any(word.lower() in str(sentence).lower() for word in important_words):
-                        insights.append(str(sentence))
-            
-        except Exception as e:
-            self.logger.warning(f"Error extracting insights from text: {e}")
+        for sentence in _SENTENCE_SPLIT_RE.split(text):
+            if 20 < len(sentence) < 100:
+                # Check if sentence contains important keywords
+                lowered = sentence.lower()
+                if any(word in lowered for word in _IMPORTANT_WORDS):
+                    insights.append(sentence)
+                    if len(insights) >= 5:
+                        break
         
-        return insights[:5]
+        return insights
     
-    def _generate_hashtags(self, title: str, summary: str) -> List[str]:
-        """Generate relevant hashtags for the content."""
-        hashtags = []
-        
-        # Get default hashtags from config
-        default_hashtags = config.get_post_generation().get('hashtags', {}).get('default', [])
-        hashtags.extend(default_hashtags)
-        
-        # Extract topic-specific hashtags
-        text = f"{title} {summary}".lower()
-        
-        # AI/ML specific hashtags
-        if any(word in text for word in ['ai', 'artificial intelligence']):
-            hashtags.append('#ArtificialIntelligence')
-        if any(word in text for word in ['machine learning', 'ml']):
-            hashtags.append('#MachineLearning')
-        if any(word in text for word in ['deep learning', 'neural network']):
-            hashtags.append('#DeepLearning')
-        if any(word in text for word in ['data science', 'data scientist']):
-            hashtags.append('#DataScience')
-        if any(word in text for word in ['nlp', 'natural language']):
-            hashtags.append('#NLP')
-        if any(word in text for word in ['computer vision', 'cv']):
-            hashtags.append('#ComputerVision')
-        if any(word in text for word in ['robotics', 'robot']):
-            hashtags.append('#Robotics')
-        if any(word in text for word in ['startup', 'entrepreneur']):
-            hashtags.append('#Startup')
-        if any(word in text for word in ['tech', 'technology']):
-            hashtags.append('#Tech')
-        
-        # Remove duplicates and limit to max hashtags
-        max_hashtags = self.content_config.get('max_hashtags', 5)
-        unique_hashtags = list(dict.fromkeys(hashtags))  # Preserve order while removing duplicates
-        
-        return unique_hashtags[:max_hashtags]
+    def _generate_hashtags(self, text: str) -> List[str]:
+        """Generate relevant hashtags for the lowercased title and summary."""
+        max_hashtags = self._max_hashtags
+        
+        # Start from the configured defaults
+        hashtags = list(self._default_hashtags)
+        
+        # Extract topic-specific hashtags, skipping tags we already have and
+        # stopping as soon as the limit is reached
+        if len(hashtags) < max_hashtags:
+            for hashtag, keywords in _TOPIC_HASHTAGS:
+                if hashtag in hashtags:
+                    continue
+                if any(word in text for word in keywords):
+                    hashtags.append(hashtag)
+                    if len(hashtags) >= max_hashtags:
+                        break
+        
+        return hashtags[:max_hashtags]
+    
+    def _fast_polarity(self, text: str) -> float:
+        """Estimate sentiment polarity of lowercased text with a lexicon lookup."""
+        return sum(_SENTIMENT_LEXICON.get(word, 0.0) for word in _WORD_RE.findall(text))
     
-    def _calculate_content_score(self, title: str, summary: str, insights: List[str]) -> float:
+    def _calculate_content_score(self, title: str, summary: str, insights: List[str],
+                                 text: str, sentiment: float = 0.0) -> float:
         """Calculate a score for content quality and relevance."""
         score = 0.0
         
@@ -218,46 +312,42 @@ class ContentProcessor:
             score += 0.2 * len(insights)
         
         # Content relevance (check for AI/ML keywords)
-        ai_keywords = ['ai', 'machine learning', 'deep learning', 'artificial intelligence', 'data science']
-        text = f"{title} {summary}".lower()
-        keyword_count = sum(1 for keyword in ai_keywords if keyword in text)
+        keyword_count = sum(1 for keyword in _AI_KEYWORDS if keyword in text)
         score += 0.1 * keyword_count
         
         # Sentiment analysis
-        try:
-            blob = TextBlob(f"{title} {summary}")
-            sentiment = blob.sentiment.polarity
-            if sentiment > 0:  # Positive sentiment
-                score += 0.1
-        except:
-            pass
+        if sentiment > 0:  # Positive sentiment
+            score += 0.1
         
         return min(score, 1.0)  # Cap at 1.0
     
-    def filter_by_quality(self, processed_articles: List[Dict[str, Any]], min_score: float = 0.5) -> List[Dict[str, Any]]:
-        """Filter articles by quality score."""
-        filtered_articles = [
+    def filter_by_quality(self, processed_articles: List[Dict[str, Any]], min_score: float = 0.5,
+                          top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Filter articles by quality score, optionally keeping only the top_k best."""
+        candidates = (
             article for article in processed_articles 
             if article.get('content_score', 0) >= min_score
-        ]
+        )
         
         # Sort by content score (highest first)
-        filtered_articles.sort(key=lambda x: x.get('content_score', 0), reverse=True)
+        score_key = lambda x: x.get('content_score', 0)
+        if top_k is not None:
+            filtered_articles = heapq.nlargest(top_k, candidates, key=score_key)
+        else:
+            filtered_articles = sorted(candidates, key=score_key, reverse=True)
         
         self.logger.info(f"Filtered {len(processed_articles)} articles to {len(filtered_articles)} high-quality articles")
         return filtered_articles
     
     def save_processed_articles(self, articles: List[Dict[str, Any]], filename: str = None) -> str:
         """Save processed articles to JSON file."""
-        import json
-        
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"data/processed_articles_{timestamp}.json"
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(articles, f, indent=2, ensure_ascii=False)
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(articles, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
             
             self.logger.info(f"Processed articles saved to: {filename}")
             return filename
@@ -265,3 +355,8 @@ class ContentProcessor:
         except Exception as e:
             self.logger.error(f"Error saving processed articles: {e}")
             raise
+
+@lru_cache(maxsize=1)
+def get_processor() -> ContentProcessor:
+    """Return the shared ContentProcessor instance for this process."""
+    return ContentProcessor()
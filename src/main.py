@@ -3,17 +3,48 @@ Main LinkedIn Post Automation Script
 """
 
 import argparse
+import atexit
 import logging
+import logging.handlers
+import mmap
+import multiprocessing
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
-import json
+import orjson
 
 from .config import config
-from .newsletter_scraper import NewsletterScraper
-from .content_processor import ContentProcessor
-from .post_generator import PostGenerator
-from .scheduler import PostScheduler
+
+# Pipeline stages are imported inside their factories, so --help and
+# single-stage commands don't pay for every stage's dependencies; each
+# stage module keeps one shared instance per process
+
+def _get_scraper():
+    """Return the shared NewsletterScraper instance."""
+    from .newsletter_scraper import get_scraper
+    return get_scraper()
+
+def _get_processor():
+    """Return the shared ContentProcessor instance."""
+    from .content_processor import get_processor
+    return get_processor()
+
+def _get_generator():
+    """Return the shared PostGenerator instance."""
+    from .post_generator import get_generator
+    return get_generator()
+
+def _get_scheduler():
+    """Return the shared PostScheduler instance."""
+    from .scheduler import get_scheduler
+    return get_scheduler()
+
+def _load_json(path: str):
+    """Load a JSON file by parsing a read-only memory map of it."""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        with memoryview(mapped) as view:
+            return orjson.loads(view)
 
 def setup_logging():
     """Setup logging configuration."""
@@ -23,14 +54,26 @@ def setup_logging():
     log_file = log_config.get('file', 'logs/linkedin_automation.log')
     Path(log_file).parent.mkdir(exist_ok=True)
     
+    handlers = [
+        logging.FileHandler(log_file),
+        logging.StreamHandler(sys.stdout)
+    ]
+    
+    # Callers only format and enqueue records; a background thread does the
+    # file and console writes, and pending records are flushed at exit.
+    # A multiprocessing queue so pool workers' records reach the listener
+    # too: forked workers inherit the handler, spawned ones are handed the
+    # queue, which only works if it comes from the spawn context
+    log_queue = multiprocessing.get_context('spawn').Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
+    
     # Configure logging
     logging.basicConfig(
         level=getattr(logging, log_config.get('level', 'INFO')),
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler(sys.stdout)
-        ]
+        handlers=[logging.handlers.QueueHandler(log_queue)]
     )
 
 def fetch_content(max_articles: int = 10):
@@ -38,7 +81,7 @@ def fetch_content(max_articles: int = 10):
     logger = logging.getLogger(__name__)
     logger.info("Starting content fetching process...")
     
-    scraper = NewsletterScraper()
+    scraper = _get_scraper()
     
     try:
         # Fetch articles from all sources
@@ -63,7 +106,7 @@ def process_content(articles):
     logger = logging.getLogger(__name__)
     logger.info("Starting content processing...")
     
-    processor = ContentProcessor()
+    processor = _get_processor()
     
     try:
         # Process articles
@@ -91,7 +134,7 @@ def generate_posts(processed_articles, max_posts: int = 5):
     logger = logging.getLogger(__name__)
     logger.info("Starting post generation...")
     
-    generator = PostGenerator()
+    generator = _get_generator()
     
     try:
         # Generate posts
@@ -105,10 +148,10 @@ def generate_posts(processed_articles, max_posts: int = 5):
         posts_file = generator.save_posts(posts)
         logger.info(f"Generated posts saved to: {posts_file}")
         
-        # Preview posts
+        # Preview posts, one log record per post; preview_post reads the
+        # length and hashtag count stored on the post instead of recomputing them
         for i, post in enumerate(posts, 1):
-            logger.info(f"\n--- Post {i} Preview ---")
-            logger.info(generator.preview_post(post))
+            logger.info(f"\n--- Post {i} Preview ---{generator.preview_post(post)}")
         
         return posts
         
@@ -121,7 +164,7 @@ def schedule_posts(posts, auto_schedule: bool = False):
     logger = logging.getLogger(__name__)
     logger.info("Setting up post scheduling...")
     
-    scheduler = PostScheduler()
+    scheduler = _get_scheduler()
     
     try:
         if auto_schedule:
@@ -190,7 +233,7 @@ def show_status():
     """Show current system status."""
     logger = logging.getLogger(__name__)
     
-    scheduler = PostScheduler()
+    scheduler = _get_scheduler()
     status = scheduler.get_queue_status()
     analytics = scheduler.get_posting_analytics()
     
@@ -211,7 +254,7 @@ def start_scheduler():
     logger = logging.getLogger(__name__)
     logger.info("Starting scheduler daemon...")
     
-    scheduler = PostScheduler()
+    scheduler = _get_scheduler()
     scheduler.start_scheduler()
 
 def main():
@@ -248,12 +291,11 @@ def main():
         elif args.process:
             # Process content only (requires existing articles file)
             articles_file = "data/articles_latest.json"
-            if not Path(articles_file).exists():
+            if not os.path.exists(articles_file):
                 logger.error(f"Articles file not found: {articles_file}")
                 sys.exit(1)
             
-            with open(articles_file, 'r') as f:
-                articles = json.load(f)
+            articles = _load_json(articles_file)
             
             processed_articles = process_content(articles)
             sys.exit(0 if processed_articles else 1)
@@ -261,12 +303,11 @@ def main():
         elif args.generate:
             # Generate posts only (requires existing processed articles file)
             processed_file = "data/processed_articles_latest.json"
-            if not Path(processed_file).exists():
+            if not os.path.exists(processed_file):
                 logger.error(f"Processed articles file not found: {processed_file}")
                 sys.exit(1)
             
-            with open(processed_file, 'r') as f:
-                processed_articles = json.load(f)
+            processed_articles = _load_json(processed_file)
             
             posts = generate_posts(processed_articles, args.max_posts)
             sys.exit(0 if posts else 1)
@@ -274,12 +315,11 @@ def main():
         elif args.schedule or args.auto_schedule:
             # Schedule posts only (requires existing posts file)
             posts_file = "data/generated_posts_latest.json"
-            if not Path(posts_file).exists():
+            if not os.path.exists(posts_file):
                 logger.error(f"Posts file not found: {posts_file}")
                 sys.exit(1)
             
-            with open(posts_file, 'r') as f:
-                posts = json.load(f)
+            posts = _load_json(posts_file)
             
             scheduled_posts = schedule_posts(posts, args.auto_schedule)
             sys.exit(0 if scheduled_posts or not args.auto_schedule else 1)
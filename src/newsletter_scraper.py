@@ -3,25 +3,238 @@ Newsletter Scraper for DeepLearning.AI content
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
+import logging.handlers
+import multiprocessing
+import multiprocessing.queues
+import os
+import threading
+import orjson
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import time
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain, repeat
+from operator import itemgetter
+from pathlib import Path
 from urllib.parse import urljoin, urlparse
 from .config import config
 
+HTTP_CACHE_FILE = "data/http_cache.json"
+_STREAM_CHUNK_SIZE = 64 * 1024
+_POOL_HOSTS = 4
+_POOL_MAXSIZE = 32
+_MAX_CONCURRENT_FETCHES = 5
+
+# Extraction pools are started from fetch threads; forking a multi-threaded
+# process can copy locks other threads hold, so workers are spawned instead
+_WORKER_CONTEXT = multiprocessing.get_context('spawn')
+
+# Selectors and class patterns shared by every parse
+_ARTICLE_SELECTORS = (
+    'article',
+    '.post',
+    '.article',
+    '.entry',
+    '[class*="post"]',
+    '[class*="article"]'
+)
+_MAX_INSIGHTS = 5
+_CLASS_POST_RE = re.compile(r'post|article|entry')
+_CLASS_SUMMARY_RE = re.compile(r'summary|description|excerpt')
+_CLASS_DATE_RE = re.compile(r'date|time')
+_CLASS_INSIGHT_RE = re.compile(r'insight|key|takeaway')
+_HEADER_TAGS = frozenset(('h1', 'h2', 'h3', 'h4'))
+_DATE_TAGS = frozenset(('time', 'span'))
+_BATCH_LINK_RE = re.compile(r'/the-batch/')
+
+def _is_article_candidate(name: str, attrs: Dict[str, Any]) -> bool:
+    """Match tags any article selector or the link fallback could select."""
+    if name == 'article':
+        return True
+    
+    classes = attrs.get('class') or ''
+    if not isinstance(classes, str):
+        classes = ' '.join(classes)
+    if _CLASS_POST_RE.search(classes):
+        return True
+    
+    return name == 'a' and '/the-batch/' in (attrs.get('href') or '')
+
+def _write_json_atomic(filename: str, data: Any, option: int) -> None:
+    """Write JSON to a temp file and swap it in, so readers never see a partial file."""
+    tmp_path = f"{filename}.tmp"
+    Path(tmp_path).write_bytes(orjson.dumps(data, option=option))
+    os.replace(tmp_path, filename)
+
+def _is_insight(node, name: str, classes: str) -> bool:
+    """Match bullet points, lists, or highlighted text (ul/ol li, strong, b, insight classes)."""
+    if name == 'strong' or name == 'b':
+        return True
+    if classes and _CLASS_INSIGHT_RE.search(classes):
+        return True
+    return name == 'li' and node.find_parent(['ul', 'ol']) is not None
+
+def _extract_article_data(element, base_url: str, scraped_at: str) -> Optional[Dict[str, Any]]:
+    """Extract article data from HTML element.
+
+    More permissive parsing to handle different layouts on the site. The
+    subtree is walked once, filling every field from the same traversal.
+    """
+    batch_link_elem = None
+    first_link_elem = None
+    title_elem = None
+    summary_elem = None
+    first_paragraph = None
+    date_elem = None
+    insights = []
+
+    for node in element.descendants:
+        name = node.name
+        if name is None:
+            continue
+        classes = node.get('class') or ''
+        if not isinstance(classes, str):
+            classes = ' '.join(classes)
+
+        if name == 'a':
+            href = node.get('href')
+            if href is not None:
+                # Prefer anchor inside article as title/link
+                if first_link_elem is None:
+                    first_link_elem = node
+                if batch_link_elem is None and '/the-batch/' in href:
+                    batch_link_elem = node
+        elif name in _HEADER_TAGS:
+            if title_elem is None:
+                title_elem = node
+        elif name == 'p' or name == 'div':
+            # Summary: prefer explicit summary/description, else first paragraph
+            if name == 'p' and first_paragraph is None:
+                first_paragraph = node
+            if summary_elem is None and classes and _CLASS_SUMMARY_RE.search(classes):
+                summary_elem = node
+        elif name in _DATE_TAGS:
+            if date_elem is None and classes and _CLASS_DATE_RE.search(classes):
+                date_elem = node
+
+        if len(insights) < _MAX_INSIGHTS and _is_insight(node, name, classes):
+            text = node.get_text(strip=True)
+            if 10 < len(text) < 200:
+                insights.append(text)
+
+        if (batch_link_elem is not None and title_elem is not None and summary_elem is not None
+                and date_elem is not None and len(insights) == _MAX_INSIGHTS):
+            break
+
+    link_elem = batch_link_elem if batch_link_elem is not None else first_link_elem
+    if summary_elem is None:
+        summary_elem = first_paragraph
+
+    # Title: from header tags or link text
+    title = title_elem.get_text(strip=True) if title_elem else ""
+    if not title and link_elem is not None:
+        title = link_elem.get_text(strip=True)
+
+    summary = summary_elem.get_text(strip=True) if summary_elem else ""
+
+    # Link: join relative link to base
+    link = ""
+    if link_elem is not None:
+        link = urljoin(base_url, link_elem.get('href'))
+
+    # Date: best-effort
+    date_str = date_elem.get_text(strip=True) if date_elem else ""
+
+    # Require at least a title and link
+    if not title or not link:
+        return None
+
+    return {
+        'title': title,
+        'summary': summary,
+        'link': link,
+        'date': date_str,
+        'insights': insights,
+        'source': 'deeplearning_ai',
+        'scraped_at': scraped_at
+    }
+
+def _init_worker_logging(log_queue, level: int, formatter: Optional[logging.Formatter]) -> None:
+    """Spawned-worker initializer: send log records to the parent's queue listener."""
+    handler = logging.handlers.QueueHandler(log_queue)
+    handler.setFormatter(formatter)
+    root = logging.getLogger()
+    root.handlers[:] = [handler]
+    root.setLevel(level)
+
+def _worker_logging_args() -> Dict[str, Any]:
+    """Pool arguments that route spawned workers' logging to the root logger's
+    multiprocessing queue, when logging is set up with one."""
+    root = logging.getLogger()
+    for handler in root.handlers:
+        if (isinstance(handler, logging.handlers.QueueHandler)
+                and isinstance(handler.queue, multiprocessing.queues.Queue)):
+            return {
+                'initializer': _init_worker_logging,
+                'initargs': (handler.queue, root.level, handler.formatter)
+            }
+    return {}
+
+def _extract_article_data_from_html(html: str, base_url: str, scraped_at: str) -> Optional[Dict[str, Any]]:
+    """Worker-process entry point: re-parse one serialized element and extract it."""
+    try:
+        element = BeautifulSoup(html, 'html.parser').find()
+        return _extract_article_data(element, base_url, scraped_at) if element else None
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Error extracting article data: {e}")
+        return None
+
+# Only build the subtrees of candidate containers (plus fallback links);
+# navigation, scripts and footers are skipped by the parser
+_ARTICLE_STRAINER = SoupStrainer(_is_article_candidate)
+
 class NewsletterScraper:
     """Scraper for DeepLearning.AI newsletters."""
     
     def __init__(self):
         self.session = requests.Session()
+        # Keep enough pooled keep-alive connections for concurrent fetches
+        # against the same host to reuse sockets instead of reconnecting
+        adapter = HTTPAdapter(pool_connections=_POOL_HOSTS, pool_maxsize=_POOL_MAXSIZE)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
         self.newsletter_sources = config.get_newsletter_sources()
         self.logger = logging.getLogger(__name__)
+        
+        # Lowercase the relevance keywords once; plain substring scans on a
+        # lowercased str beat a case-insensitive regex alternation
+        content_processing = config.get_content_processing()
+        content_filter = content_processing.get('content_filter', {})
+        self._include_keywords = self._lower_keywords(content_filter.get('keywords', []))
+        self._exclude_keywords = self._lower_keywords(content_filter.get('exclude_keywords', []))
+        
+        # Links are resolved against The Batch (empty if it is not configured,
+        # which the fetch path reports); per-article parsing fans out to
+        # worker processes once a page yields this many candidates
+        batch_source = self.newsletter_sources.get('deeplearning_ai', {}).get('batch_newsletter', {})
+        self._base_url = batch_source.get('url', '')
+        self._parallel_min = config.get_scraping().get('parallel_min_elements', 200)
+        
+        self._http_cache_lock = threading.Lock()
+        self._http_cache = {}
+        
+        # Load validators and parsed articles from previous fetches
+        Path(HTTP_CACHE_FILE).parent.mkdir(parents=True, exist_ok=True)
+        self._load_http_cache()
     
     def fetch_batch_newsletter(self, max_articles: int = 10) -> List[Dict[str, Any]]:
         """Fetch content from The Batch newsletter."""
@@ -29,11 +242,7 @@ class NewsletterScraper:
             url = self.newsletter_sources['deeplearning_ai']['batch_newsletter']['url']
             self.logger.info(f"Fetching Batch newsletter from: {url}")
             
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            articles = self._parse_batch_articles(soup, max_articles)
+            articles = self._fetch_articles(url, self._parse_batch_articles, max_articles)
             
             self.logger.info(f"Successfully fetched {len(articles)} articles from Batch newsletter")
             return articles
@@ -48,11 +257,7 @@ class NewsletterScraper:
             url = self.newsletter_sources['deeplearning_ai']['data_points']['url']
             self.logger.info(f"Fetching Data Points from: {url}")
             
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            articles = self._parse_data_points(soup, max_articles)
+            articles = self._fetch_articles(url, self._parse_data_points, max_articles)
             
             self.logger.info(f"Successfully fetched {len(articles)} articles from Data Points")
             return articles
@@ -61,68 +266,138 @@ class NewsletterScraper:
             self.logger.error(f"Error fetching Data Points: {e}")
             return []
     
+    def _fetch_articles(self, url: str, parse_func, max_articles: int) -> List[Dict[str, Any]]:
+        """Fetch a newsletter page and parse it, skipping the parse when unchanged.
+        
+        Sends If-None-Match/If-Modified-Since from the previous response; on
+        HTTP 304, or when the body hashes the same as last time, the articles
+        parsed last time are returned as-is.
+        """
+        if not self._base_url:
+            raise KeyError("newsletter_sources.deeplearning_ai.batch_newsletter.url is not configured")
+        
+        cached = self._http_cache.get(url)
+        if cached and cached.get('max_articles', 0) < max_articles:
+            cached = None
+        
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        # Stream the body so hashing overlaps the download and the connection
+        # is released as soon as the last chunk arrives
+        with self.session.get(url, timeout=30, headers=headers, stream=True) as response:
+            if response.status_code == 304 and headers:
+                self.logger.info(f"Not modified since last fetch, reusing cached articles: {url}")
+                return cached['articles'][:max_articles]
+            
+            response.raise_for_status()
+            
+            hasher = hashlib.blake2b(digest_size=16)
+            chunks = []
+            for chunk in response.iter_content(chunk_size=_STREAM_CHUNK_SIZE):
+                hasher.update(chunk)
+                chunks.append(chunk)
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+        
+        # Servers without validators still often return identical bytes
+        body_hash = hasher.hexdigest()
+        if cached and cached.get('body_hash') == body_hash:
+            self.logger.info(f"Page content unchanged, reusing cached articles: {url}")
+            return cached['articles'][:max_articles]
+        
+        soup = BeautifulSoup(b''.join(chunks), 'lxml', parse_only=_ARTICLE_STRAINER)
+        articles = parse_func(soup, max_articles)
+        
+        with self._http_cache_lock:
+            self._http_cache[url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'body_hash': body_hash,
+                'max_articles': max_articles,
+                'articles': articles
+            }
+        self._save_http_cache()
+        
+        return articles
+    
+    def _load_http_cache(self) -> None:
+        """Load the HTTP validator cache from file."""
+        try:
+            file_path = Path(HTTP_CACHE_FILE)
+            if file_path.exists():
+                self._http_cache = orjson.loads(file_path.read_bytes())
+        except Exception as e:
+            self.logger.warning(f"Could not load HTTP cache: {e}")
+            self._http_cache = {}
+    
+    def _save_http_cache(self) -> None:
+        """Save the HTTP validator cache to file."""
+        try:
+            with self._http_cache_lock:
+                _write_json_atomic(HTTP_CACHE_FILE, self._http_cache, orjson.OPT_INDENT_2)
+            
+        except Exception as e:
+            self.logger.warning(f"Could not save HTTP cache: {e}")
+    
     def _parse_batch_articles(self, soup: BeautifulSoup, max_articles: int) -> List[Dict[str, Any]]:
         """Parse articles from The Batch newsletter."""
         articles = []
         
         # Look for article containers
-        article_selectors = [
-            'article',
-            '.post',
-            '.article',
-            '.entry',
-            '[class*="post"]',
-            '[class*="article"]'
-        ]
-        
-        for selector in article_selectors:
+        for selector in _ARTICLE_SELECTORS:
             elements = soup.select(selector)
             if elements:
                 break
         
         if not elements:
             # Fallback: look for any content that might be articles
-            elements = soup.find_all(['div', 'section'], class_=re.compile(r'post|article|entry'))
+            elements = soup.find_all(['div', 'section'], class_=_CLASS_POST_RE)
 
         # If still nothing, fallback to link-based discovery for The Batch
         if not elements:
-            try:
-                link_elems = soup.select('a[href*="/the-batch/"]')
-                seen_links = set()
-                articles = []
-                for a in link_elems:
-                    href = a.get('href') or ""
-                    text = a.get_text(strip=True) or ""
-                    if not href or not text:
-                        continue
-                    # Deduplicate and only keep article-like links
-                    if href in seen_links:
-                        continue
-                    seen_links.add(href)
-                    articles.append({
-                        'title': text,
-                        'summary': '',
-                        'link': urljoin(self.newsletter_sources['deeplearning_ai']['batch_newsletter']['url'], href),
-                        'date': '',
-                        'insights': [],
-                        'source': 'deeplearning_ai',
-                        'scraped_at': datetime.now().isoformat()
-                    })
-                    if len(articles) >= max_articles:
-                        break
-                if articles:
-                    return articles
-            except Exception as e:
-                self.logger.warning(f"Fallback link parsing failed: {e}")
+            articles = self._link_fallback(soup, max_articles)
+            if articles:
+                return articles
         
-        for element in elements[:max_articles]:
-            try:
-                article = self._extract_article_data(element)
-                if article and self._is_relevant_content(article):
-                    articles.append(article)
-            except Exception as e:
-                self.logger.warning(f"Error parsing article: {e}")
-                continue
+        articles.extend(self._extract_articles(elements, max_articles))
+        
+        return articles
+    
+    def _link_fallback(self, soup: BeautifulSoup, max_articles: int) -> List[Dict[str, Any]]:
+        """Build bare articles from The Batch links when no containers match."""
+        articles = []
+        
+        try:
+            seen_links = set()
+            scraped_at = datetime.now().isoformat()
+            # A plain attribute match avoids compiling and evaluating a CSS selector
+            for a in soup.find_all('a', href=_BATCH_LINK_RE):
+                href = a.get('href') or ""
+                # Deduplicate and only keep article-like links
+                if href in seen_links:
+                    continue
+                text = a.get_text(strip=True)
+                if not text:
+                    continue
+                seen_links.add(href)
+                articles.append({
+                    'title': text,
+                    'summary': '',
+                    'link': urljoin(self._base_url, href),
+                    'date': '',
+                    'insights': [],
+                    'source': 'deeplearning_ai',
+                    'scraped_at': scraped_at
+                })
+                if len(articles) >= max_articles:
+                    break
+        except Exception as e:
+            self.logger.warning(f"Fallback link parsing failed: {e}")
         
         return articles
     
@@ -131,169 +406,119 @@ class NewsletterScraper:
         articles = []
         
         # Similar parsing logic as batch articles
-        article_selectors = [
-            'article',
-            '.post',
-            '.article',
-            '.entry',
-            '[class*="post"]',
-            '[class*="article"]'
-        ]
-        
-        for selector in article_selectors:
+        for selector in _ARTICLE_SELECTORS:
             elements = soup.select(selector)
             if elements:
                 break
         
         if not elements:
-            elements = soup.find_all(['div', 'section'], class_=re.compile(r'post|article|entry'))
+            elements = soup.find_all(['div', 'section'], class_=_CLASS_POST_RE)
         
-        for element in elements[:max_articles]:
-            try:
-                article = self._extract_article_data(element)
-                if article and self._is_relevant_content(article):
-                    articles.append(article)
-            except Exception as e:
-                self.logger.warning(f"Error parsing article: {e}")
-                continue
+        articles.extend(self._extract_articles(elements, max_articles))
         
         return articles
     
-    def _extract_article_data(self, element) -> Optional[Dict[str, Any]]:
-        """Extract article data from HTML element.
-
-        More permissive parsing to handle different layouts on the site.
-        """
+    def _extract_article_data(self, element, scraped_at: str) -> Optional[Dict[str, Any]]:
+        """Extract article data from HTML element."""
         try:
-            # Prefer anchor inside article as title/link
-            link_elem = None
-            for a in element.find_all('a', href=True):
-                href = a.get('href') or ""
-                if '/the-batch/' in href:
-                    link_elem = a
-                    break
-            if link_elem is None:
-                link_elem = element.find('a', href=True)
-
-            # Title: from header tags or link text
-            title_elem = element.find(['h1', 'h2', 'h3', 'h4'])
-            title = title_elem.get_text(strip=True) if title_elem else ""
-            if not title and link_elem is not None:
-                title = link_elem.get_text(strip=True)
-
-            # Summary: prefer explicit summary/description, else first paragraph
-            summary_elem = element.find(['p', 'div'], class_=re.compile(r'summary|description|excerpt'))
-            if not summary_elem:
-                summary_elem = element.find('p')
-            summary = summary_elem.get_text(strip=True) if summary_elem else ""
-
-            # Link: join relative link to base
-            link = ""
-            if link_elem is not None:
-                link = urljoin(
-                    self.newsletter_sources['deeplearning_ai']['batch_newsletter']['url'],
-                    link_elem.get('href')
-                )
-
-            # Date: best-effort
-            date_elem = element.find(['time', 'span'], class_=re.compile(r'date|time'))
-            date_str = date_elem.get_text(strip=True) if date_elem else ""
-
-            # Insights
-            insights = self._extract_insights(element)
-
-            # Require at least a title and link
-            if not title or not link:
-                return None
-
-            return {
-                'title': title,
-                'summary': summary,
-                'link': link,
-                'date': date_str,
-                'insights': insights,
-                'source': 'deeplearning_ai',
-                'scraped_at': datetime.now().isoformat()
-            }
-
+            return _extract_article_data(element, self._base_url, scraped_at)
         except Exception as e:
             self.logger.warning(f"Error extracting article data: {e}")
             return None
     
-    def _extract_insights(self, element) -> List[str]:
-        """Extract key insights from article element."""
-        insights = []
-        
-        # Look for bullet points, lists, or highlighted text
-        insight_selectors = [
-            'ul li',
-            'ol li',
-            '[class*="insight"]',
-            '[class*="key"]',
-            '[class*="takeaway"]',
-            'strong',
-            'b'
-        ]
+    def _extract_articles(self, elements: List[Any], max_articles: int) -> List[Dict[str, Any]]:
+        """Extract up to max_articles relevant articles from candidate elements.
+
+        Pages with many candidates are extracted in worker processes; each
+        element is shipped as serialized HTML and re-parsed there. Smaller
+        pages are extracted serially, stopping once enough articles match.
+        """
+        workers = os.cpu_count() or 1
+        # One clock read per page; every article in it shares the timestamp
+        scraped_at = datetime.now().isoformat()
         
-        for selector in insight_selectors:
-            elements = element.select(selector)
-            for elem in elements:
-                text = elem.get_text(strip=True)
-                if text and len(text) > 10 and len(text) < 200:
-                    insights.append(text)
+        if len(elements) >= self._parallel_min and workers > 1:
+            try:
+                html_blobs = [str(element) for element in elements]
+                with ProcessPoolExecutor(max_workers=workers, mp_context=_WORKER_CONTEXT,
+                                         **_worker_logging_args()) as executor:
+                    results = executor.map(
+                        _extract_article_data_from_html,
+                        html_blobs,
+                        repeat(self._base_url),
+                        repeat(scraped_at),
+                        chunksize=4
+                    )
+                    articles = [article for article in results if article and self._is_relevant_content(article)]
+                return articles[:max_articles]
+            except Exception as e:
+                self.logger.warning(f"Parallel parsing failed, falling back to serial: {e}")
         
-        return insights[:5]  # Limit to 5 insights
+        articles = []
+        for element in elements:
+            article = self._extract_article_data(element, scraped_at)
+            if article and self._is_relevant_content(article):
+                articles.append(article)
+                if len(articles) >= max_articles:
+                    break
+        return articles
+    
+    @staticmethod
+    def _lower_keywords(keywords: List[str]) -> Tuple[str, ...]:
+        """Lowercase the non-empty keywords for substring matching."""
+        return tuple(keyword.lower() for keyword in keywords if keyword)
     
     def _is_relevant_content(self, article: Dict[str, Any]) -> bool:
         """Check if article content is relevant based on keywords."""
-        content_filter = config.get_content_processing().get('content_filter', {})
-        include_keywords = content_filter.get('keywords', [])
-        exclude_keywords = content_filter.get('exclude_keywords', [])
-        
         text = f"{article['title']} {article['summary']}".lower()
         
         # Check for excluded keywords
-        for keyword in exclude_keywords:
-            if keyword.lower() in text:
-                return False
-        
-        # Check for included keywords
-        if include_keywords:
-            for keyword in include_keywords:
-                if keyword.lower() in text:
-                    return True
+        if any(keyword in text for keyword in self._exclude_keywords):
             return False
         
-        return True
+        # Check for included keywords
+        return not self._include_keywords or any(keyword in text for keyword in self._include_keywords)
     
     def fetch_all_newsletters(self, max_articles_per_source: int = 5) -> List[Dict[str, Any]]:
         """Fetch content from all configured newsletter sources."""
         all_articles = []
+        fetchers = (self.fetch_batch_newsletter, self.fetch_data_points)
         
-        # Fetch from different sources
-        batch_articles = self.fetch_batch_newsletter(max_articles_per_source)
-        data_points_articles = self.fetch_data_points(max_articles_per_source)
+        # Fetch every source concurrently over the shared session so the
+        # network waits overlap; results come back in source order
+        with ThreadPoolExecutor(max_workers=min(_MAX_CONCURRENT_FETCHES, len(fetchers))) as executor:
+            source_articles = list(executor.map(lambda fetch: fetch(max_articles_per_source), fetchers))
         
-        all_articles.extend(batch_articles)
-        all_articles.extend(data_points_articles)
+        # Drop articles that appear in more than one source (same link or mirrored title)
+        seen = set()
+        for article in chain.from_iterable(source_articles):
+            link_key = self._normalize_link(article.get('link', ''))
+            title_key = article.get('title', '').strip().lower()
+            if (link_key and link_key in seen) or (title_key and title_key in seen):
+                continue
+            seen.update(key for key in (link_key, title_key) if key)
+            all_articles.append(article)
         
-        # Sort by date if available
-        all_articles.sort(key=lambda x: x.get('date', ''), reverse=True)
+        # Sort by date if available; with no dates the stable sort is a no-op
+        if any(article['date'] for article in all_articles):
+            all_articles.sort(key=itemgetter('date'), reverse=True)
         
         self.logger.info(f"Total articles fetched: {len(all_articles)}")
         return all_articles
     
+    @staticmethod
+    def _normalize_link(link: str) -> str:
+        """Normalize an article link for deduplication (drops query and fragment)."""
+        return urlparse(link)._replace(query='', fragment='').geturl()
+    
     def save_articles(self, articles: List[Dict[str, Any]], filename: str = None) -> str:
         """Save fetched articles to JSON file."""
-        import json
-        
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"data/articles_{timestamp}.json"
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(articles, f, indent=2, ensure_ascii=False)
+            _write_json_atomic(filename, articles, orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
             
             self.logger.info(f"Articles saved to: {filename}")
             return filename
@@ -301,3 +526,8 @@ class NewsletterScraper:
         except Exception as e:
             self.logger.error(f"Error saving articles: {e}")
             raise
+
+@lru_cache(maxsize=1)
+def get_scraper() -> NewsletterScraper:
+    """Return the shared NewsletterScraper instance for this process."""
+    return NewsletterScraper()
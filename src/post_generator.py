@@ -4,11 +4,85 @@ LinkedIn Post Generator
 
 import random
 import logging
-from typing import List, Dict, Any, Optional
+import multiprocessing as mp
+from typing import Callable, List, Dict, Any, Optional
 from datetime import datetime
 import re
+import orjson
+from functools import lru_cache
+from string import Formatter
 from .config import config
 
+# Cleanup and scoring patterns, compiled once for every generated post
+_RE_BLANK_LINES = re.compile(r'\n\s*\n')
+_RE_SPACES = re.compile(r' +')
+_RE_PRE_PUNCT = re.compile(r'\s+([.,!?;:])')
+_RE_DUP_PUNCT = re.compile(r'([.,!?;:])\s*([.,!?;:])')
+_EMOJIS = '🎯📊🤖💡🚀⚡🔗📖🔍'
+_CTA_WORDS = ('read', 'learn', 'discover', 'explore', 'check')
+_RE_PLACEHOLDER = re.compile(r'\{(?:title|summary|insights|link|hashtags)\}')
+_FALLBACK_TEMPLATE = "🎯 {title}\n\n{summary}\n\n💡 Key insights:\n{insights}\n\n🔗 Read more: {link}\n\n{hashtags}"
+
+def _score_engagement(length: int, hashtag_count: int, emoji_count: int,
+                      has_question: bool, has_cta: bool, content_score: float) -> float:
+    """Score a post's engagement potential from its extracted features."""
+    score = 0.0
+    
+    # Content length score (optimal length around 1000-1300 characters)
+    if 800 <= length <= 1300:
+        score += 0.3
+    elif 500 <= length <= 1500:
+        score += 0.2
+    
+    # Hashtag score
+    if 3 <= hashtag_count <= 5:
+        score += 0.2
+    elif 1 <= hashtag_count <= 7:
+        score += 0.1
+    
+    # Emoji score (presence of emojis)
+    if 1 <= emoji_count <= 5:
+        score += 0.1
+    
+    # Question score (questions increase engagement)
+    if has_question:
+        score += 0.1
+    
+    # Call-to-action score
+    if has_cta:
+        score += 0.1
+    
+    # Original article quality score
+    score += 0.2 * content_score
+    
+    return min(score, 1.0)
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to at most limit characters, ending with '...' when shortened."""
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
+@lru_cache(maxsize=32)
+def _compile_template(template: str) -> Callable[[Dict[str, Any]], str]:
+    """Specialize a template into a renderer taking a dict of fields.
+
+    Templates with only plain {name} fields are rewritten once into a
+    %-style mapping format, which fills them in C without re-parsing;
+    conversions, format specs and attribute/index lookups are left to
+    str.format_map.
+    """
+    parts = []
+    for literal, field, format_spec, conversion in Formatter().parse(template):
+        if field is not None and (not field.isidentifier() or format_spec or conversion):
+            return template.format_map
+        parts.append(literal.replace('%', '%%'))
+        if field is not None:
+            parts.append(f'%({field})s')
+    return ''.join(parts).__mod__
+
+def _render_template(template: str, **fields: Any) -> str:
+    """Fill a template using its specialized renderer."""
+    return _compile_template(template)(fields)
+
 class PostGenerator:
     """Generate LinkedIn posts from processed content."""
     
@@ -16,38 +90,74 @@ class PostGenerator:
         self.logger = logging.getLogger(__name__)
         self.post_config = config.get_post_generation()
         self.templates = self.post_config.get('templates', [])
+        # Parse every template up front so generation only fills fields
+        for template in self.templates or [_FALLBACK_TEMPLATE]:
+            _compile_template(template)
         self.hashtags_config = self.post_config.get('hashtags', {})
+        self._min_len = config.min_post_length
+        self._max_len = config.max_post_length
     
     def generate_posts(self, processed_articles: List[Dict[str, Any]], max_posts: int = 5) -> List[Dict[str, Any]]:
         """Generate LinkedIn posts from processed articles."""
+        articles = processed_articles[:max_posts]
+        
+        # Draw every post's template in one call rather than once per post
+        if self.templates:
+            templates = random.choices(self.templates, k=len(articles))
+        else:
+            templates = [_FALLBACK_TEMPLATE] * len(articles)
+        
+        parallel_min = self.post_config.get('parallel_min_posts', 200)
+        if len(articles) >= parallel_min and mp.cpu_count() > 1:
+            posts = self._generate_posts_parallel(articles, templates)
+        else:
+            posts = self._generate_posts_serial(articles, templates)
+        
+        self.logger.info(f"Generated {len(posts)} LinkedIn posts")
+        return posts
+    
+    def _generate_posts_serial(self, articles: List[Dict[str, Any]], templates: List[str]) -> List[Dict[str, Any]]:
+        """Generate posts one by one in this process."""
         posts = []
         
-        for article in processed_articles[:max_posts]:
+        for article, template in zip(articles, templates):
             try:
-                post = self.generate_single_post(article)
+                post = self.generate_single_post(article, template)
                 if post:
                     posts.append(post)
             except Exception as e:
                 self.logger.error(f"Error generating post for article '{article.get('title', 'Unknown')}': {e}")
                 continue
         
-        self.logger.info(f"Generated {len(posts)} LinkedIn posts")
         return posts
     
-    def generate_single_post(self, article: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _generate_posts_parallel(self, articles: List[Dict[str, Any]], templates: List[str]) -> List[Dict[str, Any]]:
+        """Generate posts across a pool of worker processes."""
+        try:
+            with mp.Pool(min(mp.cpu_count(), len(articles))) as pool:
+                results = pool.starmap(self.generate_single_post, zip(articles, templates), chunksize=4)
+            return [post for post in results if post]
+        except Exception as e:
+            self.logger.warning(f"Parallel generation failed, falling back to serial: {e}")
+            return self._generate_posts_serial(articles, templates)
+    
+    def generate_single_post(self, article: Dict[str, Any], template: str = None) -> Optional[Dict[str, Any]]:
         """Generate a single LinkedIn post from processed article."""
         try:
-            # Select a random template
-            template = self._select_template()
+            # Select a random template unless the caller already picked one
+            if not template:
+                template = self._select_template()
             
             # Format insights
             formatted_insights = self._format_insights(article.get('key_insights', []))
             
             # Format hashtags
-            formatted_hashtags = self._format_hashtags(article.get('hashtags', []))
+            hashtags = article.get('hashtags', [])
+            formatted_hashtags = self._format_hashtags(hashtags)
             
             # Generate post content
-            post_content = template.format(
+            post_content = _render_template(
+                template,
                 title=article.get('title', ''),
                 summary=article.get('summary', ''),
                 insights=formatted_insights,
@@ -63,14 +173,17 @@ class PostGenerator:
                 return None
             
             # Create post object
+            hashtag_count = len(hashtags)
             post = {
                 'content': post_content,
                 'article': article,
                 'template_used': template,
                 'generated_at': datetime.now().isoformat(),
                 'post_length': len(post_content),
-                'hashtag_count': len(article.get('hashtags', [])),
-                'engagement_score': self._calculate_engagement_score(post_content, article)
+                'hashtag_count': hashtag_count,
+                'engagement_score': self._calculate_engagement_score(
+                    post_content, hashtag_count, article.get('content_score', 0)
+                )
             }
             
             return post
@@ -83,7 +196,7 @@ class PostGenerator:
         """Select a random template from available templates."""
         if not self.templates:
             # Fallback template
-            return "🎯 {title}\n\n{summary}\n\n💡 Key insights:\n{insights}\n\n🔗 Read more: {link}\n\n{hashtags}"
+            return _FALLBACK_TEMPLATE
         
         return random.choice(self.templates)
     
@@ -92,16 +205,8 @@ class PostGenerator:
         if not insights:
             return "• No specific insights available"
         
-        formatted_insights = []
-        for i, insight in enumerate(insights[:3], 1):  # Limit to 3 insights
-            # Clean and truncate insight
-            clean_insight = insight.strip()
-            if len(clean_insight) > 100:
-                clean_insight = clean_insight[:97] + "..."
-            
-            formatted_insights.append(f"• {clean_insight}")
-        
-        return "\n".join(formatted_insights)
+        # Clean and truncate insights, limited to 3
+        return "\n".join([f"• {_truncate(insight.strip(), 100)}" for insight in insights[:3]])
     
     def _format_hashtags(self, hashtags: List[str]) -> str:
         """Format hashtags for post display."""
@@ -109,23 +214,17 @@ class PostGenerator:
             return ""
         
         # Ensure hashtags start with #
-        formatted_hashtags = []
-        for hashtag in hashtags:
-            if not hashtag.startswith('#'):
-                hashtag = f"#{hashtag}"
-            formatted_hashtags.append(hashtag)
-        
-        return " ".join(formatted_hashtags)
+        return " ".join([hashtag if hashtag.startswith('#') else f"#{hashtag}" for hashtag in hashtags])
     
     def _clean_post_content(self, content: str) -> str:
         """Clean and format post content."""
         # Remove extra whitespace
-        content = re.sub(r'\n\s*\n', '\n\n', content)
-        content = re.sub(r' +', ' ', content)
+        content = _RE_BLANK_LINES.sub('\n\n', content)
+        content = _RE_SPACES.sub(' ', content)
         
         # Fix common formatting issues
-        content = re.sub(r'\s+([.,!?;:])', r'\1', content)
-        content = re.sub(r'([.,!?;:])\s*([.,!?;:])', r'\1', content)
+        content = _RE_PRE_PUNCT.sub(r'\1', content)
+        content = _RE_DUP_PUNCT.sub(r'\1', content)
         
         # Ensure proper line breaks
         content = content.strip()
@@ -135,13 +234,11 @@ class PostGenerator:
     def _validate_post(self, content: str) -> bool:
         """Validate generated post content."""
         # Check length
-        max_length = config.get_content_processing().get('max_post_length', 1300)
-        if len(content) > max_length:
+        if len(content) > self._max_len:
             self.logger.warning(f"Post too long: {len(content)} characters")
             return False
         
-        min_length = config.get_content_processing().get('min_post_length', 100)
-        if len(content) < min_length:
+        if len(content) < self._min_len:
             self.logger.warning(f"Post too short: {len(content)} characters")
             return False
         
@@ -150,51 +247,26 @@ class PostGenerator:
             return False
         
         # Check for placeholder values
-        placeholders = ['{title}', '{summary}', '{insights}', '{link}', '{hashtags}']
-        for placeholder in placeholders:
-            if placeholder in content:
-                self.logger.warning(f"Post contains unformatted placeholder: {placeholder}")
-                return False
+        # A single memchr for '{' rules out almost every post before the regex
+        placeholder = _RE_PLACEHOLDER.search(content) if '{' in content else None
+        if placeholder:
+            self.logger.warning(f"Post contains unformatted placeholder: {placeholder.group(0)}")
+            return False
         
         return True
     
-    def _calculate_engagement_score(self, content: str, article: Dict[str, Any]) -> float:
+    def _calculate_engagement_score(self, content: str, hashtag_count: int, content_score: float) -> float:
         """Calculate potential engagement score for the post."""
-        score = 0.0
-        
-        # Content length score (optimal length around 1000-1300 characters)
-        length = len(content)
-        if 800 <= length <= 1300:
-            score += 0.3
-        elif 500 <= length <= 1500:
-            score += 0.2
-        
-        # Hashtag score
-        hashtag_count = len(article.get('hashtags', []))
-        if 3 <= hashtag_count <= 5:
-            score += 0.2
-        elif 1 <= hashtag_count <= 7:
-            score += 0.1
-        
-        # Emoji score (presence of emojis)
-        emoji_count = len(re.findall(r'[🎯📊🤖💡🚀⚡🔗📖🔍]', content))
-        if 1 <= emoji_count <= 5:
-            score += 0.1
-        
-        # Question score (questions increase engagement)
-        if '?' in content:
-            score += 0.1
-        
-        # Call-to-action score
-        cta_words = ['read', 'learn', 'discover', 'explore', 'check']
-        if any(word in content.lower() for word in cta_words):
-            score += 0.1
-        
-        # Original article quality score
-        original_score = article.get('content_score', 0)
-        score += 0.2 * original_score
-        
-        return min(score, 1.0)
+        # String scanning happens here; the scoring itself is plain arithmetic
+        content_lower = content.lower()
+        return _score_engagement(
+            len(content),
+            hashtag_count,
+            sum(map(content.count, _EMOJIS)),
+            '?' in content,
+            any(word in content_lower for word in _CTA_WORDS),
+            content_score
+        )
     
     def generate_custom_post(self, title: str, summary: str, insights: List[str], 
                            link: str, hashtags: List[str], template: str = None) -> Optional[Dict[str, Any]]:
@@ -211,7 +283,8 @@ class PostGenerator:
             formatted_hashtags = self._format_hashtags(hashtags)
             
             # Generate post
-            post_content = selected_template.format(
+            post_content = _render_template(
+                selected_template,
                 title=title,
                 summary=summary,
                 insights=formatted_insights,
@@ -240,15 +313,13 @@ class PostGenerator:
     
     def save_posts(self, posts: List[Dict[str, Any]], filename: str = None) -> str:
         """Save generated posts to JSON file."""
-        import json
-        
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"data/generated_posts_{timestamp}.json"
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(posts, f, indent=2, ensure_ascii=False)
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(posts, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
             
             self.logger.info(f"Generated posts saved to: {filename}")
             return filename
@@ -271,3 +342,8 @@ Generated: {post.get('generated_at', 'Unknown')}
 === END PREVIEW ===
 """
         return preview
+
+@lru_cache(maxsize=1)
+def get_generator() -> PostGenerator:
+    """Return the shared PostGenerator instance for this process."""
+    return PostGenerator()
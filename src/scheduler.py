@@ -2,27 +2,119 @@
 LinkedIn Post Scheduler
 """
 
-import schedule
+import heapq
 import time
 import logging
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from datetime import datetime, timedelta
-import json
+from collections import defaultdict
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import os
 from pathlib import Path
 from .config import config
 
+SCHEDULED_POSTS_FILE = "data/scheduled_posts.json"
+SCHEDULED_EVENTS_FILE = "data/scheduled_posts.jsonl"
+
+# Longest single sleep in the scheduler loop, so stop_scheduler() and newly
+# scheduled posts are picked up promptly
+_MAX_SLEEP_SECONDS = 60
+
+# Most LinkedIn API calls in flight at once when several posts fall due together
+_MAX_CONCURRENT_POSTS = 4
+
+# linkedin.rate_limit keys and the sliding window, in seconds, each one covers
+_RATE_LIMIT_WINDOWS = (('posts_per_hour', 3600), ('posts_per_day', 86400))
+
+# Fold the event log into the snapshot once it holds this many events per post
+_COMPACT_RATIO = 10
+
+# Pending posts loaded more than this many minutes past their slot are
+# marked missed instead of being published late
+_DEFAULT_MISSED_GRACE_MINUTES = 60
+
+@lru_cache(maxsize=8)
+def _posting_slots(posting_times: Tuple[str, ...]) -> List[int]:
+    """Convert 'HH:MM' posting times to sorted minutes after midnight."""
+    return sorted(int(hour) * 60 + int(minute) for hour, minute in (t.split(':') for t in posting_times))
+
+def _read_scheduled_posts(snapshot_file: str = SCHEDULED_POSTS_FILE,
+                          events_file: str = SCHEDULED_EVENTS_FILE) -> Tuple[List[Dict[str, Any]], int]:
+    """Read the posts snapshot and replay the event log over it.
+
+    Each log line is {post_id, fields, ts}: a new post logs all its fields,
+    later changes log only the fields they touch. Returns the posts and the
+    number of events replayed.
+    """
+    posts = []
+    snapshot_path = Path(snapshot_file)
+    if snapshot_path.exists():
+        posts = orjson.loads(snapshot_path.read_bytes())
+    
+    event_count = 0
+    events_path = Path(events_file)
+    if events_path.exists():
+        by_id = {post.get('post_id'): post for post in posts}
+        with open(events_path, 'rb') as f:
+            for line in f:
+                try:
+                    event = orjson.loads(line)
+                except ValueError:
+                    # Torn last line from an interrupted append
+                    continue
+                
+                post = by_id.get(event['post_id'])
+                if post is None:
+                    post = by_id[event['post_id']] = {}
+                    posts.append(post)
+                post.update(event['fields'])
+                event_count += 1
+    
+    return posts, event_count
+
+def load_scheduled_posts() -> List[Dict[str, Any]]:
+    """Load the current scheduled posts (snapshot plus logged changes)."""
+    return _read_scheduled_posts()[0]
+
 class PostScheduler:
     """Schedule and manage LinkedIn posts."""
     
-    def __init__(self):
+    def __init__(self, dry_run: bool = False, posts_file: str = SCHEDULED_POSTS_FILE,
+                 events_file: str = SCHEDULED_EVENTS_FILE):
         self.logger = logging.getLogger(__name__)
+        # In dry-run mode due posts are logged and marked posted without
+        # calling LinkedIn, for exercising the scheduler end to end
+        self.dry_run = dry_run
+        self.posts_file = posts_file
+        self.events_file = events_file
         self.scheduling_config = config.get_scheduling()
         self.linkedin_config = config.get_linkedin_config()
+        # (limit, window seconds) pairs from linkedin.rate_limit, and the
+        # sorted times of publish attempts still inside the longest window
+        rate_limit = self.linkedin_config.get('rate_limit') or {}
+        self._rate_limits = tuple(
+            (rate_limit[key], window) for key, window in _RATE_LIMIT_WINDOWS if rate_limit.get(key)
+        )
+        self._publish_times = []
         self.scheduled_posts = []
         self.post_queue = []
         self.is_running = False
         
+        # Min-heap of (scheduled timestamp, post_id) for pending posts, plus
+        # post_id and status indexes so lookups don't scan scheduled_posts
+        self._heap = []
+        self._by_id = {}
+        self._by_status = defaultdict(dict)
+        # Running engagement total over posted posts, for analytics
+        self._posted_engagement = 0.0
+        # Last analytics result and the day it was computed for; cleared
+        # whenever a post is indexed or changes status
+        self._analytics = None
+        self._analytics_day = None
+        
         # Load existing scheduled posts
         self._load_scheduled_posts()
     
@@ -37,6 +129,14 @@ class PostScheduler:
         
         scheduled_posts = []
         current_time = datetime.now()
+        created_at = current_time.isoformat()
+        
+        # One timestamp prefix per batch; numbering continues past any posts
+        # already scheduled within the same second so ids stay unique
+        id_prefix = f"post_{current_time.strftime('%Y%m%d_%H%M%S')}"
+        first_index = 0
+        while f"{id_prefix}_{first_index}" in self._by_id:
+            first_index += 1
         
         for i, post in enumerate(posts[:max_posts_per_day]):
             try:
@@ -50,14 +150,14 @@ class PostScheduler:
                     'post': post,
                     'scheduled_time': posting_time.isoformat(),
                     'status': 'scheduled',
-                    'created_at': current_time.isoformat(),
-                    'post_id': f"post_{current_time.strftime('%Y%m%d_%H%M%S')}_{i}"
+                    'created_at': created_at,
+                    'post_id': f"{id_prefix}_{first_index + i}"
                 }
                 
                 scheduled_posts.append(scheduled_post)
                 
                 # Schedule the post
-                self._schedule_single_post(scheduled_post)
+                self._schedule_single_post(scheduled_post, posting_time)
                 
             except Exception as e:
                 self.logger.error(f"Error scheduling post {i}: {e}")
@@ -65,7 +165,9 @@ class PostScheduler:
         
         # Add to scheduled posts list
         self.scheduled_posts.extend(scheduled_posts)
-        self._save_scheduled_posts()
+        for scheduled_post in scheduled_posts:
+            self._index_post(scheduled_post)
+        self._append_events(scheduled_posts, ts=created_at)
         
         self.logger.info(f"Scheduled {len(scheduled_posts)} posts")
         return scheduled_posts
@@ -73,60 +175,109 @@ class PostScheduler:
     def _calculate_posting_time(self, current_time: datetime, posting_times: List[str], 
                                post_index: int, min_interval_hours: int) -> datetime:
         """Calculate the optimal posting time for a post."""
-        # Start with today
-        target_date = current_time.date()
-        
-        # If we've already passed today's posting times, move to tomorrow
-        for time_str in posting_times:
-            hour, minute = map(int, time_str.split(':'))
-            posting_time = datetime.combine(target_date, datetime.min.time().replace(hour=hour, minute=minute))
-            
-            if posting_time > current_time:
-                # Found a valid time today
-                return posting_time
+        slots = _posting_slots(tuple(posting_times))
+        midnight = current_time.replace(hour=0, minute=0, second=0, microsecond=0)
         
-        # Move to tomorrow and use the first posting time
-        target_date += timedelta(days=1)
-        hour, minute = map(int, posting_times[0].split(':'))
-        return datetime.combine(target_date, datetime.min.time().replace(hour=hour, minute=minute))
+        # First slot strictly after the current minute today, else tomorrow's first slot
+        index = bisect_right(slots, current_time.hour * 60 + current_time.minute)
+        if index < len(slots):
+            return midnight + timedelta(minutes=slots[index])
+        return midnight + timedelta(days=1, minutes=slots[0])
     
-    def _schedule_single_post(self, scheduled_post: Dict[str, Any]) -> None:
-        """Schedule a single post using the schedule library."""
+    def _schedule_single_post(self, scheduled_post: Dict[str, Any],
+                              scheduled_time: Optional[datetime] = None) -> None:
+        """Schedule a single post on the scheduler's event heap."""
         try:
-            scheduled_time = datetime.fromisoformat(scheduled_post['scheduled_time'])
+            # Callers that just computed the time pass it to skip re-parsing
+            if scheduled_time is None:
+                scheduled_time = datetime.fromisoformat(scheduled_post['scheduled_time'])
             
             # Schedule the post
-            schedule.every().day.at(scheduled_time.strftime('%H:%M')).do(
-                self._post_to_linkedin, scheduled_post
-            )
+            heapq.heappush(self._heap, (scheduled_time.timestamp(), scheduled_post['post_id']))
             
             self.logger.info(f"Scheduled post '{scheduled_post['post_id']}' for {scheduled_time}")
             
         except Exception as e:
             self.logger.error(f"Error scheduling post: {e}")
     
+    def _index_post(self, post: Dict[str, Any]) -> None:
+        """Add a post to the post_id and status indexes."""
+        post_id = post.get('post_id')
+        self._analytics = None
+        self._by_id[post_id] = post
+        self._by_status[post.get('status')][post_id] = post
+        if post.get('status') == 'posted':
+            self._posted_engagement += post['post'].get('engagement_score', 0)
+    
+    def _set_status(self, post: Dict[str, Any], status: str) -> None:
+        """Change a post's status, moving it between status buckets."""
+        post_id = post.get('post_id')
+        old_status = post.get('status')
+        self._analytics = None
+        self._by_status[old_status].pop(post_id, None)
+        post['status'] = status
+        self._by_status[status][post_id] = post
+        
+        if old_status != status and 'posted' in (old_status, status):
+            engagement = post['post'].get('engagement_score', 0)
+            self._posted_engagement += engagement if status == 'posted' else -engagement
+    
+    def _publish(self, scheduled_post: Dict[str, Any]) -> None:
+        """Send one post to LinkedIn (placeholder for actual LinkedIn API integration)."""
+        if self.dry_run:
+            self.logger.info(f"Dry run, not posting to LinkedIn: {scheduled_post['post_id']}")
+            return
+        
+        self.logger.info(f"Posting to LinkedIn: {scheduled_post['post_id']}")
+        
+        # Here you would integrate with LinkedIn API
+        # For now, we'll just log the post content
+        post_content = scheduled_post['post']['content']
+        self.logger.info(f"Post content:\n{post_content}")
+    
     def _post_to_linkedin(self, scheduled_post: Dict[str, Any]) -> None:
-        """Post content to LinkedIn (placeholder for actual LinkedIn API integration)."""
+        """Post content to LinkedIn and record the outcome."""
+        self._post_due_posts([scheduled_post])
+    
+    def _post_due_posts(self, due_posts: List[Dict[str, Any]]) -> None:
+        """Publish due posts, overlapping their network calls, and record the outcomes.
+
+        Only the publishing runs on worker threads; status changes and the
+        event log are updated from this thread.
+        """
+        self._record_publish_times([time.time()] * len(due_posts))
+        if len(due_posts) == 1:
+            outcomes = [(due_posts[0], self._try_publish(due_posts[0]))]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(due_posts), _MAX_CONCURRENT_POSTS)) as executor:
+                outcomes = list(zip(due_posts, executor.map(self._try_publish, due_posts)))
+        
+        posted_at = datetime.now().isoformat()
+        posted, failed = [], []
+        for scheduled_post, error in outcomes:
+            if error is None:
+                self._set_status(scheduled_post, 'posted')
+                scheduled_post['posted_at'] = posted_at
+                posted.append(scheduled_post)
+            else:
+                self.logger.error(f"Error posting to LinkedIn: {error}")
+                self._set_status(scheduled_post, 'failed')
+                scheduled_post['error'] = str(error)
+                failed.append(scheduled_post)
+        
+        # Save updated status
+        if posted:
+            self._append_events(posted, ('status', 'posted_at'), ts=posted_at)
+        if failed:
+            self._append_events(failed, ('status', 'error'), ts=posted_at)
+    
+    def _try_publish(self, scheduled_post: Dict[str, Any]) -> Optional[Exception]:
+        """Publish a post, returning the error instead of raising it."""
         try:
-            self.logger.info(f"Posting to LinkedIn: {scheduled_post['post_id']}")
-            
-            # Update post status
-            scheduled_post['status'] = 'posted'
-            scheduled_post['posted_at'] = datetime.now().isoformat()
-            
-            # Here you would integrate with LinkedIn API
-            # For now, we'll just log the post content
-            post_content = scheduled_post['post']['content']
-            self.logger.info(f"Post content:\n{post_content}")
-            
-            # Save updated status
-            self._save_scheduled_posts()
-            
+            self._publish(scheduled_post)
+            return None
         except Exception as e:
-            self.logger.error(f"Error posting to LinkedIn: {e}")
-            scheduled_post['status'] = 'failed'
-            scheduled_post['error'] = str(e)
-            self._save_scheduled_posts()
+            return e
     
     def add_to_queue(self, posts: List[Dict[str, Any]]) -> None:
         """Add posts to the posting queue."""
@@ -138,8 +289,8 @@ class PostScheduler:
         return {
             'queue_size': len(self.post_queue),
             'scheduled_posts': len(self.scheduled_posts),
-            'posted_today': len([p for p in self.scheduled_posts if p.get('status') == 'posted']),
-            'failed_posts': len([p for p in self.scheduled_posts if p.get('status') == 'failed'])
+            'posted_today': len(self._by_status['posted']),
+            'failed_posts': len(self._by_status['failed'])
         }
     
     def clear_queue(self) -> None:
@@ -150,18 +301,19 @@ class PostScheduler:
     def get_scheduled_posts(self, status: str = None) -> List[Dict[str, Any]]:
         """Get scheduled posts, optionally filtered by status."""
         if status:
-            return [post for post in self.scheduled_posts if post.get('status') == status]
+            return list(self._by_status[status].values())
         return self.scheduled_posts.copy()
     
     def cancel_post(self, post_id: str) -> bool:
         """Cancel a scheduled post."""
-        for post in self.scheduled_posts:
-            if post.get('post_id') == post_id and post.get('status') == 'scheduled':
-                post['status'] = 'cancelled'
-                post['cancelled_at'] = datetime.now().isoformat()
-                self._save_scheduled_posts()
-                self.logger.info(f"Cancelled post: {post_id}")
-                return True
+        post = self._by_status['scheduled'].get(post_id)
+        if post is not None:
+            self._set_status(post, 'cancelled')
+            cancelled_at = datetime.now().isoformat()
+            post['cancelled_at'] = cancelled_at
+            self._append_events([post], ('status', 'cancelled_at'), ts=cancelled_at)
+            self.logger.info(f"Cancelled post: {post_id}")
+            return True
         
         self.logger.warning(f"Post not found or already processed: {post_id}")
         return False
@@ -177,8 +329,28 @@ class PostScheduler:
         
         try:
             while self.is_running:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
+                if not self._heap:
+                    time.sleep(_MAX_SLEEP_SECONDS)
+                    continue
+                
+                # Sleep until the earliest post is due instead of polling
+                due_at, post_id = self._heap[0]
+                delay = due_at - time.time()
+                if delay > 0:
+                    time.sleep(min(delay, _MAX_SLEEP_SECONDS))
+                    continue
+                
+                # Hold due posts back while the LinkedIn rate limit is used up
+                now = time.time()
+                allowance, wait = self._publish_allowance(now)
+                if allowance <= 0:
+                    time.sleep(min(wait, _MAX_SLEEP_SECONDS))
+                    continue
+                
+                # Take the posts that are due now, up to the allowance, and publish them together
+                due_posts = self._pop_due_posts(now, allowance)
+                if due_posts:
+                    self._post_due_posts(due_posts)
         except KeyboardInterrupt:
             self.logger.info("Scheduler stopped by user")
             self.is_running = False
@@ -186,31 +358,137 @@ class PostScheduler:
             self.logger.error(f"Scheduler error: {e}")
             self.is_running = False
     
+    def _pop_due_posts(self, now: float, limit: float = float('inf')) -> List[Dict[str, Any]]:
+        """Pop up to limit live heap entries due at or before now and return their posts."""
+        due_posts = []
+        while self._heap and self._heap[0][0] <= now and len(due_posts) < limit:
+            due_at, post_id = heapq.heappop(self._heap)
+            scheduled_post = self._by_id.get(post_id)
+            if self._is_due_entry(scheduled_post, due_at):
+                due_posts.append(scheduled_post)
+        return due_posts
+    
+    def _publish_allowance(self, now: float) -> Tuple[float, float]:
+        """Return how many posts linkedin.rate_limit allows now, and the seconds
+        until the next one is allowed when that is none."""
+        if not self._rate_limits:
+            return float('inf'), 0.0
+        
+        times = self._publish_times
+        del times[:bisect_left(times, now - max(window for _, window in self._rate_limits))]
+        
+        allowance, wait = float('inf'), 0.0
+        for limit, window in self._rate_limits:
+            remaining = limit - (len(times) - bisect_left(times, now - window))
+            if remaining <= 0:
+                # The window frees a call once the limit-th most recent attempt ages out
+                wait = max(wait, times[-limit] + window - now)
+            allowance = min(allowance, remaining)
+        return allowance, wait
+    
+    def _record_publish_times(self, times: List[float]) -> None:
+        """Count publish attempts against the rate limit."""
+        if self._rate_limits:
+            self._publish_times.extend(times)
+            self._publish_times.sort()
+    
+    @staticmethod
+    def _is_due_entry(scheduled_post: Optional[Dict[str, Any]], due_at: float) -> bool:
+        """Check a popped heap entry is still live (not cancelled, posted, or rescheduled)."""
+        if not scheduled_post or scheduled_post.get('status') != 'scheduled':
+            return False
+        return datetime.fromisoformat(scheduled_post['scheduled_time']).timestamp() == due_at
+    
     def stop_scheduler(self) -> None:
         """Stop the scheduler daemon."""
         self.is_running = False
         self.logger.info("Scheduler stopped")
     
     def _load_scheduled_posts(self) -> None:
-        """Load scheduled posts from file."""
+        """Load scheduled posts from the snapshot and event log."""
         try:
-            file_path = Path("data/scheduled_posts.json")
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    self.scheduled_posts = json.load(f)
+            self.scheduled_posts, event_count = _read_scheduled_posts(self.posts_file, self.events_file)
+            if self.scheduled_posts:
                 self.logger.info(f"Loaded {len(self.scheduled_posts)} scheduled posts")
+            
+            # Pending posts from earlier runs go back on the event heap, unless
+            # their slot passed too long ago to still be worth publishing
+            grace_minutes = self.scheduling_config.get('missed_grace_minutes', _DEFAULT_MISSED_GRACE_MINUTES)
+            cutoff = time.time() - grace_minutes * 60
+            missed = []
+            posted_times = []
+            for post in self.scheduled_posts:
+                self._index_post(post)
+                if post.get('posted_at'):
+                    posted_times.append(datetime.fromisoformat(post['posted_at']).timestamp())
+                if post.get('status') == 'scheduled':
+                    due_at = datetime.fromisoformat(post['scheduled_time']).timestamp()
+                    if due_at < cutoff:
+                        missed.append(post)
+                    else:
+                        heapq.heappush(self._heap, (due_at, post['post_id']))
+            
+            # Posts published by earlier runs still count against the rate limit
+            self._record_publish_times(posted_times)
+            if missed:
+                self._mark_missed(missed)
+            
+            if event_count > _COMPACT_RATIO * max(len(self.scheduled_posts), 1):
+                self._save_scheduled_posts()
         except Exception as e:
             self.logger.warning(f"Could not load scheduled posts: {e}")
             self.scheduled_posts = []
+            self._heap = []
+            self._by_id = {}
+            self._by_status = defaultdict(dict)
+            self._posted_engagement = 0.0
+            self._analytics = None
+    
+    def _mark_missed(self, posts: List[Dict[str, Any]]) -> None:
+        """Mark overdue pending posts as missed so they are never published late."""
+        missed_at = datetime.now().isoformat()
+        for post in posts:
+            self._set_status(post, 'missed')
+            post['missed_at'] = missed_at
+        self._append_events(posts, ('status', 'missed_at'), ts=missed_at)
+        self.logger.warning(f"Marked {len(posts)} overdue posts as missed")
+    
+    def _append_events(self, posts: List[Dict[str, Any]], fields: Tuple[str, ...] = (),
+                       ts: str = None) -> None:
+        """Append one event per post to the log: the given fields, or the whole post."""
+        try:
+            file_path = Path(self.events_file)
+            file_path.parent.mkdir(exist_ok=True)
+            
+            if ts is None:
+                ts = datetime.now().isoformat()
+            lines = []
+            for post in posts:
+                changed = {field: post.get(field) for field in fields} if fields else post
+                lines.append(orjson.dumps(
+                    {'post_id': post['post_id'], 'fields': changed, 'ts': ts},
+                    option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+                ))
+            
+            with open(file_path, 'ab') as f:
+                f.write(b''.join(lines))
+            
+        except Exception as e:
+            self.logger.error(f"Error saving scheduled posts: {e}")
     
     def _save_scheduled_posts(self) -> None:
-        """Save scheduled posts to file."""
+        """Write the full snapshot and clear the event log it now contains."""
         try:
-            file_path = Path("data/scheduled_posts.json")
+            file_path = Path(self.posts_file)
             file_path.parent.mkdir(exist_ok=True)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.scheduled_posts, f, indent=2, ensure_ascii=False)
+            # Swap in a complete file so a crash never leaves a partial snapshot
+            tmp_path = file_path.with_suffix('.json.tmp')
+            tmp_path.write_bytes(orjson.dumps(self.scheduled_posts, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            os.replace(tmp_path, file_path)
+            
+            Path(self.events_file).unlink(missing_ok=True)
+            self.logger.info(f"Compacted scheduled posts log into {self.posts_file}")
             
         except Exception as e:
             self.logger.error(f"Error saving scheduled posts: {e}")
@@ -220,51 +498,64 @@ class PostScheduler:
         if not self.scheduled_posts:
             return {}
         
+        # posted_at is ISO formatted, so its first 10 characters are the date
+        today = datetime.now().date().isoformat()
+        if self._analytics is not None and self._analytics_day == today:
+            return self._analytics.copy()
+        
         total_posts = len(self.scheduled_posts)
-        posted_posts = [p for p in self.scheduled_posts if p.get('status') == 'posted']
-        failed_posts = [p for p in self.scheduled_posts if p.get('status') == 'failed']
+        posted_posts = self._by_status['posted']
+        failed_posts = self._by_status['failed']
         
-        # Calculate engagement scores
-        engagement_scores = [p['post'].get('engagement_score', 0) for p in posted_posts]
-        avg_engagement = sum(engagement_scores) / len(engagement_scores) if engagement_scores else 0
+        # Engagement is kept as a running total as posts enter and leave 'posted'
+        avg_engagement = self._posted_engagement / len(posted_posts) if posted_posts else 0
         
-        return {
+        self._analytics = {
             'total_posts': total_posts,
             'posted_posts': len(posted_posts),
             'failed_posts': len(failed_posts),
             'success_rate': len(posted_posts) / total_posts if total_posts > 0 else 0,
             'average_engagement_score': avg_engagement,
-            'posts_today': len([p for p in posted_posts if 
-                              datetime.fromisoformat(p.get('posted_at', '')).date() == datetime.now().date()])
+            'posts_today': sum(1 for p in posted_posts.values() if p.get('posted_at', '')[:10] == today)
         }
+        self._analytics_day = today
+        return self._analytics.copy()
     
     def reschedule_failed_posts(self) -> List[Dict[str, Any]]:
         """Reschedule posts that failed to post."""
-        failed_posts = [p for p in self.scheduled_posts if p.get('status') == 'failed']
+        failed_posts = list(self._by_status['failed'].values())
         rescheduled = []
+        if not failed_posts:
+            return rescheduled
+        
+        # Every failed post moves to the same next available time
+        now = datetime.now()
+        rescheduled_at = now.isoformat()
+        posting_times = self.scheduling_config.get('posting_times', ['09:00', '12:00', '17:00'])
+        new_time = self._calculate_posting_time(now, posting_times, 0, 1)
+        new_time_iso = new_time.isoformat()
         
         for post in failed_posts:
             try:
                 # Reset status
-                post['status'] = 'scheduled'
-                post['rescheduled_at'] = datetime.now().isoformat()
-                
-                # Reschedule for next available time
-                posting_times = self.scheduling_config.get('posting_times', ['09:00', '12:00', '17:00'])
-                new_time = self._calculate_posting_time(
-                    datetime.now(), posting_times, 0, 1
-                )
-                post['scheduled_time'] = new_time.isoformat()
+                self._set_status(post, 'scheduled')
+                post['rescheduled_at'] = rescheduled_at
+                post['scheduled_time'] = new_time_iso
                 
                 # Schedule the post
-                self._schedule_single_post(post)
+                self._schedule_single_post(post, new_time)
                 rescheduled.append(post)
                 
             except Exception as e:
                 self.logger.error(f"Error rescheduling post {post.get('post_id')}: {e}")
         
         if rescheduled:
-            self._save_scheduled_posts()
+            self._append_events(rescheduled, ('status', 'rescheduled_at', 'scheduled_time'), ts=rescheduled_at)
             self.logger.info(f"Rescheduled {len(rescheduled)} failed posts")
         
         return rescheduled
+
+@lru_cache(maxsize=1)
+def get_scheduler() -> PostScheduler:
+    """Return the shared PostScheduler instance for this process."""
+    return PostScheduler()
@@ -4,7 +4,7 @@ LinkedIn Post Automation - UI Launcher
 Simple script to launch the Streamlit web interface.
 """
 
-import subprocess
+import importlib.util
 import sys
 import os
 from pathlib import Path
@@ -26,16 +26,15 @@ def main():
         print("Make sure to activate your virtual environment first:")
         print("source ../linkedinagent/bin/activate")
     
-    # Check if required packages are installed
-    try:
-        import streamlit
-        import plotly
-        print("✅ Required packages found")
-    except ImportError as e:
-        print(f"❌ Missing required package: {e}")
+    # Check if required packages are installed (locate them without importing;
+    # the Streamlit process imports them itself)
+    missing = [name for name in ('streamlit', 'plotly') if importlib.util.find_spec(name) is None]
+    if missing:
+        print(f"❌ Missing required package: {', '.join(missing)}")
         print("Please install required packages:")
         print("pip install streamlit plotly")
         sys.exit(1)
+    print("✅ Required packages found")
     
     # Launch Streamlit
     print("🌐 Launching web interface...")
@@ -44,17 +43,18 @@ def main():
     print("\nPress Ctrl+C to stop the server")
     print("=" * 50)
     
+    # Replace this process with Streamlit rather than waiting on a child, so
+    # there is no idle launcher and Ctrl+C goes straight to the server
+    sys.stdout.flush()
     try:
         # Run streamlit with specific configuration
-        subprocess.run([
+        os.execv(sys.executable, [
             sys.executable, "-m", "streamlit", "run", "web_ui.py",
             "--server.port", "8590",
             "--server.address", "localhost",
             "--browser.gatherUsageStats", "false"
         ])
-    except KeyboardInterrupt:
-        print("\n👋 Web UI stopped by user")
-    except Exception as e:
+    except OSError as e:
         print(f"❌ Error starting web UI: {e}")
         sys.exit(1)
 
@@ -5,22 +5,21 @@ A Streamlit-based web interface for managing LinkedIn post automation.
 """
 
 import streamlit as st
+import heapq
 import sys
-import json
 import os
 from pathlib import Path
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from src.newsletter_scraper import NewsletterScraper
-from src.content_processor import ContentProcessor
-from src.post_generator import PostGenerator
-from src.scheduler import PostScheduler
+from src.scheduler import (
+    PostScheduler, SCHEDULED_POSTS_FILE, SCHEDULED_EVENTS_FILE,
+    load_scheduled_posts as load_scheduled_posts_from_disk,
+)
 from src.config import Config
 
 # Page configuration
@@ -47,6 +46,13 @@ st.markdown("""
         border-radius: 0.5rem;
         border-left: 4px solid #0077B5;
     }
+    .metric-row {
+        display: flex;
+        gap: 1rem;
+    }
+    .metric-row .metric-card {
+        flex: 1;
+    }
     .post-preview {
         background-color: #ffffff;
         border: 1px solid #e0e0e0;
@@ -65,34 +71,90 @@ def load_config():
     """Load configuration."""
     return Config()
 
-@st.cache_data
-def load_scheduled_posts():
-    """Load scheduled posts from JSON file."""
-    try:
-        with open('data/scheduled_posts.json', 'r') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return []
+# Dtypes for the analytics columns; status has a handful of distinct values
+_ANALYTICS_DTYPES = {
+    'status': 'category',
+    'engagement_score': 'float32',
+    'post_length': 'Int32',
+}
 
-@st.cache_data
-def get_analytics_data():
-    """Get analytics data for visualization."""
-    posts = load_scheduled_posts()
+# Status indicator shown next to each post
+_STATUS_ICONS = {
+    'scheduled': '🟡',
+    'posted': '🟢',
+    'failed': '🔴',
+    'missed': '🟠',
+}
+
+def _post_fields(post):
+    """Return a post's display fields, with defaults, in one pass."""
+    get = post.get
+    return (
+        get('title', 'Untitled'),
+        get('status', 'unknown'),
+        get('scheduled_time', 'Not scheduled'),
+        get('engagement_score', 0),
+        get('post_length', 0),
+        get('content', ''),
+        get('post_id'),
+    )
+
+def scheduled_posts_signature():
+    """Return (mtime_ns, size) of the posts snapshot and change log, None if missing."""
+    signature = []
+    for path in (SCHEDULED_POSTS_FILE, SCHEDULED_EVENTS_FILE):
+        try:
+            stat = os.stat(path)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.append(None)
+    return tuple(signature)
+
+# The cached loaders take the file signature as their cache key, so a rerun
+# reuses the parsed posts until the scheduler writes either file
+
+@st.cache_data(max_entries=4)
+def load_scheduled_posts(signature):
+    """Load scheduled posts (snapshot plus the scheduler's change log)."""
+    return load_scheduled_posts_from_disk()
+
+# Columns each page reads from the analytics frame; the large content
+# column is only built for the post management search
+_DASHBOARD_COLUMNS = ('status',)
+_MANAGEMENT_COLUMNS = ('status', 'title', 'content')
+_ANALYTICS_COLUMNS = ('status', 'scheduled_time', 'created_time', 'engagement_score', 'post_length')
+
+@st.cache_data(max_entries=12)
+def get_analytics_data(signature, columns=_ANALYTICS_COLUMNS):
+    """Get analytics data for visualization, limited to the given columns."""
+    posts = load_scheduled_posts(signature)
     if not posts:
         return pd.DataFrame()
     
-    df = pd.DataFrame(posts)
-    # Safely parse datetime fields; create fallbacks if missing
-    if 'scheduled_time' in df.columns:
-        df['scheduled_time'] = pd.to_datetime(df['scheduled_time'], errors='coerce')
-    else:
-        df['scheduled_time'] = pd.NaT
+    # Build column lists directly rather than handing pandas a list of row
+    # dicts; a column is left out when no post has that field
+    data = {
+        column: [post.get(column) for post in posts]
+        for column in columns if any(column in post for post in posts)
+    }
+    df = pd.DataFrame(data, index=pd.RangeIndex(len(posts)))
+    # Give the analytics columns compact typed storage instead of object
+    df = df.astype({column: dtype for column, dtype in _ANALYTICS_DTYPES.items() if column in df.columns},
+                   errors='ignore')
+    # Safely parse datetime fields; create fallbacks if missing. The scheduler
+    # writes ISO 8601, so the format hint skips per-value format inference
+    if 'scheduled_time' in columns:
+        if 'scheduled_time' in df.columns:
+            df['scheduled_time'] = pd.to_datetime(df['scheduled_time'], format='ISO8601', errors='coerce', cache=True)
+        else:
+            df['scheduled_time'] = pd.NaT
 
-    if 'created_time' in df.columns:
-        df['created_time'] = pd.to_datetime(df['created_time'], errors='coerce')
-    else:
-        # Fallback: use scheduled_time if available, otherwise current time
-        df['created_time'] = df['scheduled_time'].fillna(pd.Timestamp.now())
+    if 'created_time' in columns:
+        if 'created_time' in df.columns:
+            df['created_time'] = pd.to_datetime(df['created_time'], format='ISO8601', errors='coerce', cache=True)
+        else:
+            # Fallback: use scheduled_time if available, otherwise current time
+            df['created_time'] = df.get('scheduled_time', pd.Series(pd.NaT, index=df.index)).fillna(pd.Timestamp.now())
     return df
 
 def main():
@@ -108,17 +170,18 @@ def main():
     
     # Load data
     config = load_config()
-    scheduled_posts = load_scheduled_posts()
-    analytics_df = get_analytics_data()
+    signature = scheduled_posts_signature()
+    scheduled_posts = load_scheduled_posts(signature)
     
+    # Each page builds (or reuses) a frame with only the columns it reads
     if page == "Dashboard":
-        show_dashboard(scheduled_posts, analytics_df)
+        show_dashboard(scheduled_posts, get_analytics_data(signature, _DASHBOARD_COLUMNS))
     elif page == "Content Pipeline":
         show_content_pipeline()
     elif page == "Post Management":
-        show_post_management(scheduled_posts)
+        show_post_management(scheduled_posts, get_analytics_data(signature, _MANAGEMENT_COLUMNS))
     elif page == "Analytics":
-        show_analytics(analytics_df)
+        show_analytics(get_analytics_data(signature), signature)
     elif page == "Settings":
         show_settings(config)
 
@@ -126,64 +189,41 @@ def show_dashboard(scheduled_posts, analytics_df):
     """Show the main dashboard."""
     st.header("📊 Dashboard")
     
-    # Key metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>Total Posts</h3>
-            <h2>{len(scheduled_posts)}</h2>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        scheduled_count = len([p for p in scheduled_posts if p.get('status') == 'scheduled'])
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>Scheduled</h3>
-            <h2 class="status-warning">{scheduled_count}</h2>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        posted_count = len([p for p in scheduled_posts if p.get('status') == 'posted'])
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>Posted</h3>
-            <h2 class="status-success">{posted_count}</h2>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        failed_count = len([p for p in scheduled_posts if p.get('status') == 'failed'])
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3>Failed</h3>
-            <h2 class="status-error">{failed_count}</h2>
-        </div>
-        """, unsafe_allow_html=True)
+    # Key metrics; status counts come from one pass over the cached frame
+    if 'status' in analytics_df.columns:
+        status_counts = analytics_df['status'].value_counts().to_dict()
+    else:
+        status_counts = {}
+    
+    # All four cards go out as a single markdown element
+    metrics = (
+        ("Total Posts", len(scheduled_posts), ""),
+        ("Scheduled", status_counts.get('scheduled', 0), "status-warning"),
+        ("Posted", status_counts.get('posted', 0), "status-success"),
+        ("Failed", status_counts.get('failed', 0), "status-error"),
+    )
+    cards = "".join(
+        f'<div class="metric-card"><h3>{label}</h3><h2 class="{css_class}">{value}</h2></div>'
+        for label, value, css_class in metrics
+    )
+    st.markdown(f'<div class="metric-row">{cards}</div>', unsafe_allow_html=True)
     
     # Recent activity
     st.subheader("🕒 Recent Activity")
     
     if scheduled_posts:
-        recent_posts = sorted(scheduled_posts, key=lambda x: x.get('created_time', ''), reverse=True)[:5]
+        recent_posts = heapq.nlargest(5, scheduled_posts, key=lambda x: x.get('created_time', ''))
         
         for post in recent_posts:
-            with st.expander(f"{post.get('title', 'Untitled')} - {post.get('status', 'unknown')}"):
+            title, status, scheduled_time, engagement, length, _, _ = _post_fields(post)
+            with st.expander(f"{title} - {status}"):
                 col1, col2 = st.columns([3, 1])
                 with col1:
-                    st.write(f"**Scheduled for:** {post.get('scheduled_time', 'Not scheduled')}")
-                    st.write(f"**Engagement Score:** {post.get('engagement_score', 0):.2f}")
-                    st.write(f"**Length:** {post.get('post_length', 0)} characters")
+                    st.write(f"**Scheduled for:** {scheduled_time}")
+                    st.write(f"**Engagement Score:** {engagement:.2f}")
+                    st.write(f"**Length:** {length} characters")
                 with col2:
-                    status_color = {
-                        'scheduled': '🟡',
-                        'posted': '🟢',
-                        'failed': '🔴'
-                    }.get(post.get('status'), '⚪')
-                    st.write(f"{status_color} {post.get('status', 'unknown')}")
+                    st.write(f"{_STATUS_ICONS.get(status, '⚪')} {status}")
     else:
         st.info("No posts found. Run the content pipeline to generate posts.")
     
@@ -229,6 +269,11 @@ def show_content_pipeline():
         status_text = st.empty()
         
         try:
+            # Pipeline stages are only imported when a run is requested
+            from src.newsletter_scraper import NewsletterScraper
+            from src.content_processor import ContentProcessor
+            from src.post_generator import PostGenerator
+            
             # Step 1: Fetch content
             status_text.text("Step 1/4: Fetching content...")
             progress_bar.progress(25)
@@ -278,7 +323,13 @@ def show_content_pipeline():
             st.error(f"Pipeline failed: {str(e)}")
             st.exception(e)
 
-def show_post_management(scheduled_posts):
+def _column_matches(df, column, predicate):
+    """Apply a vectorized predicate to a column, or match nothing if it is missing."""
+    if column not in df.columns:
+        return pd.Series(False, index=df.index)
+    return predicate(df[column])
+
+def show_post_management(scheduled_posts, analytics_df):
     """Show post management interface."""
     st.header("📝 Post Management")
     
@@ -290,7 +341,7 @@ def show_post_management(scheduled_posts):
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        status_filter = st.selectbox("Filter by Status", ["All", "scheduled", "posted", "failed"])
+        status_filter = st.selectbox("Filter by Status", ["All", "scheduled", "posted", "failed", "missed"])
     
     with col2:
         date_filter = st.date_input("Filter by Date", value=datetime.now().date())
@@ -298,31 +349,34 @@ def show_post_management(scheduled_posts):
     with col3:
         search_term = st.text_input("Search Posts", placeholder="Enter title or content...")
     
-    # Filter posts
-    filtered_posts = scheduled_posts
+    # Filter posts with column masks on the cached frame; its rows are in
+    # the same order as scheduled_posts
+    mask = pd.Series(True, index=analytics_df.index)
     
     if status_filter != "All":
-        filtered_posts = [p for p in filtered_posts if p.get('status') == status_filter]
+        mask &= _column_matches(analytics_df, 'status', lambda column: column.eq(status_filter))
     
     if search_term:
-        filtered_posts = [p for p in filtered_posts 
-                         if search_term.lower() in p.get('title', '').lower() 
-                         or search_term.lower() in p.get('content', '').lower()]
+        contains = lambda column: column.str.contains(search_term, case=False, regex=False, na=False)
+        mask &= (_column_matches(analytics_df, 'title', contains)
+                 | _column_matches(analytics_df, 'content', contains))
+    
+    filtered_posts = [scheduled_posts[i] for i in mask.to_numpy().nonzero()[0]]
     
     # Display posts
     st.subheader(f"Posts ({len(filtered_posts)} found)")
     
     for post in filtered_posts:
-        with st.expander(f"{post.get('title', 'Untitled')} - {post.get('status', 'unknown')}"):
+        title, status, scheduled_time, engagement, length, content, post_id = _post_fields(post)
+        with st.expander(f"{title} - {status}"):
             col1, col2 = st.columns([3, 1])
             
             with col1:
-                st.write(f"**Scheduled for:** {post.get('scheduled_time', 'Not scheduled')}")
-                st.write(f"**Engagement Score:** {post.get('engagement_score', 0):.2f}")
-                st.write(f"**Length:** {post.get('post_length', 0)} characters")
+                st.write(f"**Scheduled for:** {scheduled_time}")
+                st.write(f"**Engagement Score:** {engagement:.2f}")
+                st.write(f"**Length:** {length} characters")
                 
                 # Post content preview
-                content = post.get('content', '')
                 if len(content) > 300:
                     st.text_area("Content Preview", content[:300] + "...", height=100, disabled=True)
                 else:
@@ -330,22 +384,61 @@ def show_post_management(scheduled_posts):
             
             with col2:
                 # Status indicator
-                status_color = {
-                    'scheduled': '🟡',
-                    'posted': '🟢',
-                    'failed': '🔴'
-                }.get(post.get('status'), '⚪')
-                st.write(f"{status_color} {post.get('status', 'unknown')}")
+                st.write(f"{_STATUS_ICONS.get(status, '⚪')} {status}")
                 
                 # Action buttons
-                if post.get('status') == 'scheduled':
-                    if st.button("📤 Post Now", key=f"post_{post.get('post_id')}"):
+                if status == 'scheduled':
+                    if st.button("📤 Post Now", key=f"post_{post_id}"):
                         st.info("Posting functionality requires LinkedIn API integration.")
                 
-                if st.button("🗑️ Delete", key=f"delete_{post.get('post_id')}"):
+                if st.button("🗑️ Delete", key=f"delete_{post_id}"):
                     st.warning("Delete functionality not implemented yet.")
 
-def show_analytics(analytics_df):
+# Analytics figures are cached on the same file signature as the data, so
+# revisiting the page reuses them until the scheduler writes again; plotly
+# is imported only when a figure is first built. They are cached as shared
+# resources because st.cache_data would unpickle (and revalidate) every
+# figure on each rerun, which costs more than serializing it for the chart
+
+@st.cache_resource(max_entries=4)
+def daily_posts_figure(signature):
+    """Line chart of posts per scheduled day."""
+    import plotly.express as px
+    
+    # Floor to days and count in datetime64 arrays, without per-row date objects
+    days = get_analytics_data(signature)['scheduled_time'].to_numpy().astype('datetime64[D]')
+    dates, post_counts = np.unique(days[~np.isnat(days)], return_counts=True)
+    daily_posts = pd.DataFrame({'date': dates, 'post_count': post_counts})
+    
+    return px.line(daily_posts, x='date', y='post_count', 
+                   title='Daily Post Count',
+                   labels={'date': 'Date', 'post_count': 'Number of Posts'})
+
+@st.cache_resource(max_entries=4)
+def engagement_figure(signature):
+    """Histogram of engagement scores."""
+    import plotly.express as px
+    
+    return px.histogram(get_analytics_data(signature), x='engagement_score', 
+                        title='Distribution of Engagement Scores',
+                        labels={'engagement_score': 'Engagement Score', 'count': 'Number of Posts'})
+
+@st.cache_resource(max_entries=4)
+def status_figure(signature):
+    """Pie chart of post statuses."""
+    import plotly.express as px
+    
+    status_counts = get_analytics_data(signature)['status'].value_counts()
+    return px.pie(values=status_counts.values, names=status_counts.index,
+                  title='Post Status Distribution')
+
+def _column_mean(column):
+    """Mean of a numeric column as a float64 numpy reduction, ignoring missing values."""
+    values = pd.to_numeric(column, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    present = values[~np.isnan(values)]
+    return float(present.mean()) if present.size else float('nan')
+
+def show_analytics(analytics_df, signature):
     """Show analytics and visualizations."""
     st.header("📈 Analytics")
     
@@ -355,34 +448,19 @@ def show_analytics(analytics_df):
     
     # Time series of posts
     st.subheader("Post Activity Over Time")
-    
-    if not analytics_df.empty:
-        # Group by date and count posts
-        daily_posts = analytics_df.groupby(analytics_df['scheduled_time'].dt.date).size().reset_index()
-        daily_posts.columns = ['date', 'post_count']
-        
-        fig = px.line(daily_posts, x='date', y='post_count', 
-                     title='Daily Post Count',
-                     labels={'date': 'Date', 'post_count': 'Number of Posts'})
-        st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(daily_posts_figure(signature), use_container_width=True)
     
     # Engagement score distribution
     st.subheader("Engagement Score Distribution")
     
     if 'engagement_score' in analytics_df.columns:
-        fig = px.histogram(analytics_df, x='engagement_score', 
-                          title='Distribution of Engagement Scores',
-                          labels={'engagement_score': 'Engagement Score', 'count': 'Number of Posts'})
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(engagement_figure(signature), use_container_width=True)
     
     # Status distribution
     st.subheader("Post Status Distribution")
     
     if 'status' in analytics_df.columns:
-        status_counts = analytics_df['status'].value_counts()
-        fig = px.pie(values=status_counts.values, names=status_counts.index,
-                    title='Post Status Distribution')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(status_figure(signature), use_container_width=True)
     
     # Summary statistics
     st.subheader("Summary Statistics")
@@ -394,12 +472,12 @@ def show_analytics(analytics_df):
     
     with col2:
         if 'engagement_score' in analytics_df.columns:
-            avg_engagement = analytics_df['engagement_score'].mean()
+            avg_engagement = _column_mean(analytics_df['engagement_score'])
             st.metric("Avg Engagement", f"{avg_engagement:.2f}")
     
     with col3:
         if 'post_length' in analytics_df.columns:
-            avg_length = analytics_df['post_length'].mean()
+            avg_length = _column_mean(analytics_df['post_length'])
             st.metric("Avg Post Length", f"{avg_length:.0f} chars")
 
 def show_settings(config):